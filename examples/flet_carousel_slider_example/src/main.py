@@ -5,6 +5,8 @@ from flet_carousel_slider import (
     FletCarouselSlider,
     ScrollDirection,
     CenterPageEnlargeStrategy,
+    CarouselIndicator,
+    IndicatorPosition,
 )
 
 
@@ -55,7 +57,7 @@ def main(page: ft.Page):
     current_page_text = ft.Text("Current page: 0", size=16, weight=ft.FontWeight.BOLD)
 
     # Carousel reference (will be set later)
-    carousel = None
+    carousel: FletCarouselSlider
 
     def on_page_changed(data):
         """Event handler receives data using new attribute access"""
@@ -68,47 +70,53 @@ def main(page: ft.Page):
 
     # Interactive Controls for Carousel Parameters
     def update_carousel():
-        """Recreate carousel with new parameters"""
-        nonlocal carousel
-
-        # Get current values from controls
-        new_carousel = FletCarouselSlider(
-            items=carousel_items,
-            height=height_slider.value,
-            aspect_ratio=aspect_ratio_slider.value,
-            viewport_fraction=viewport_slider.value,
-            initial_page=int(initial_page_slider.value),
-            enable_infinite_scroll=infinite_scroll_checkbox.value,
-            animate_to_closest=animate_closest_checkbox.value,
-            reverse=reverse_checkbox.value,
-            auto_play=auto_play_checkbox.value,
-            auto_play_interval=int(auto_play_interval_slider.value),
-            auto_play_animation=ft.Animation(
-                int(auto_play_duration_slider.value),
-                getattr(ft.AnimationCurve, auto_play_curve_dropdown.value),
-            ),
-            enlarge_center_page=enlarge_center_checkbox.value,
-            enlarge_factor=enlarge_factor_slider.value,
-            enlarge_strategy=getattr(
-                CenterPageEnlargeStrategy, enlarge_strategy_dropdown.value
-            ),
-            page_snapping=page_snapping_checkbox.value,
-            scroll_direction=getattr(ScrollDirection, scroll_direction_dropdown.value),
-            pause_auto_play_on_touch=pause_on_touch_checkbox.value,
-            pause_auto_play_on_manual_navigate=pause_on_manual_checkbox.value,
-            pause_auto_play_in_finite_scroll=pause_in_finite_checkbox.value,
-            disable_center=disable_center_checkbox.value,
-            pad_ends=pad_ends_checkbox.value,
-            clip_behavior=getattr(ft.ClipBehavior, clip_behavior_dropdown.value),
-            enable_scroll_events=scroll_events_checkbox.value,
-            on_page_changed=on_page_changed,
-            on_scrolled=on_scrolled if scroll_events_checkbox.value else None,
+        """Apply the new parameters to the existing carousel in place"""
+        # Only changed attributes are sent; position, autoplay and items are kept
+        carousel.height = height_slider.value
+        carousel.aspect_ratio = aspect_ratio_slider.value
+        carousel.viewport_fraction = viewport_slider.value
+        carousel.initial_page = int(initial_page_slider.value)
+        carousel.enable_infinite_scroll = infinite_scroll_checkbox.value
+        carousel.animate_to_closest = animate_closest_checkbox.value
+        carousel.reverse = reverse_checkbox.value
+        carousel.auto_play = auto_play_checkbox.value
+        carousel.auto_play_interval = int(auto_play_interval_slider.value)
+        carousel.auto_play_animation = ft.Animation(
+            int(auto_play_duration_slider.value),
+            getattr(ft.AnimationCurve, auto_play_curve_dropdown.value),
         )
-
-        # Replace carousel in the layout
-        carousel_container.content = new_carousel
-        carousel = new_carousel
-        page.update()
+        carousel.enlarge_center_page = enlarge_center_checkbox.value
+        carousel.enlarge_factor = enlarge_factor_slider.value
+        carousel.enlarge_strategy = getattr(
+            CenterPageEnlargeStrategy, enlarge_strategy_dropdown.value
+        )
+        carousel.page_snapping = page_snapping_checkbox.value
+        carousel.scroll_direction = getattr(
+            ScrollDirection, scroll_direction_dropdown.value
+        )
+        carousel.pause_auto_play_on_touch = pause_on_touch_checkbox.value
+        carousel.pause_auto_play_on_manual_navigate = pause_on_manual_checkbox.value
+        carousel.pause_auto_play_in_finite_scroll = pause_in_finite_checkbox.value
+        carousel.disable_center = disable_center_checkbox.value
+        carousel.pad_ends = pad_ends_checkbox.value
+        carousel.clip_behavior = getattr(ft.ClipBehavior, clip_behavior_dropdown.value)
+        carousel.enable_scroll_events = scroll_events_checkbox.value
+        carousel.on_scrolled = on_scrolled if scroll_events_checkbox.value else None
+        # These add or remove wrappers around the slider on the client; the
+        # current page must survive toggling them
+        carousel.keyboard_navigation = keyboard_navigation_checkbox.value
+        carousel.auto_play_schedule = (
+            [1500, 4000] if auto_play_schedule_checkbox.value else None
+        )
+        carousel.auto_play_wait_for_ready = wait_for_ready_checkbox.value
+        carousel.indicator = (
+            CarouselIndicator(
+                position=getattr(IndicatorPosition, indicator_dropdown.value)
+            )
+            if indicator_dropdown.value != "NONE"
+            else None
+        )
+        carousel.update()
 
     # Sliders
     height_slider = ft.Slider(
@@ -217,6 +225,15 @@ def main(page: ft.Page):
     scroll_events_checkbox = ft.Checkbox(
         label="Enable Scroll Events", value=False, on_change=lambda e: update_carousel()
     )
+    keyboard_navigation_checkbox = ft.Checkbox(
+        label="Keyboard Navigation", value=False, on_change=lambda e: update_carousel()
+    )
+    auto_play_schedule_checkbox = ft.Checkbox(
+        label="Per-slide Schedule", value=False, on_change=lambda e: update_carousel()
+    )
+    wait_for_ready_checkbox = ft.Checkbox(
+        label="Wait for Ready Slides", value=False, on_change=lambda e: update_carousel()
+    )
 
     # Dropdowns
     auto_play_curve_dropdown = ft.Dropdown(
@@ -254,6 +271,19 @@ def main(page: ft.Page):
         on_change=lambda e: update_carousel(),
     )
 
+    indicator_dropdown = ft.Dropdown(
+        label="Indicator",
+        value="NONE",
+        options=[
+            ft.dropdown.Option("NONE"),
+            ft.dropdown.Option("BOTTOM"),
+            ft.dropdown.Option("TOP"),
+            ft.dropdown.Option("OVERLAY_BOTTOM"),
+            ft.dropdown.Option("OVERLAY_TOP"),
+        ],
+        on_change=lambda e: update_carousel(),
+    )
+
     clip_behavior_dropdown = ft.Dropdown(
         label="Clip Behavior",
         value="ANTI_ALIAS",
@@ -588,6 +618,8 @@ def main(page: ft.Page):
                     ft.Text("Auto Play Duration", size=12, weight=ft.FontWeight.BOLD),
                     auto_play_duration_slider,
                     auto_play_curve_dropdown,
+                    auto_play_schedule_checkbox,
+                    wait_for_ready_checkbox,
 
                     ft.Divider(),
 
@@ -609,6 +641,7 @@ def main(page: ft.Page):
                     disable_center_checkbox,
                     pad_ends_checkbox,
                     scroll_events_checkbox,
+                    keyboard_navigation_checkbox,
 
                     ft.Divider(),
 
@@ -616,6 +649,7 @@ def main(page: ft.Page):
                     ft.Text("🎨 Style & Direction", size=16, weight=ft.FontWeight.BOLD),
                     enlarge_strategy_dropdown,
                     scroll_direction_dropdown,
+                    indicator_dropdown,
                     clip_behavior_dropdown,
 
                 ], spacing=8, scroll=ft.ScrollMode.AUTO, expand=True),
@@ -653,6 +687,7 @@ def main(page: ft.Page):
                             ft.Text("• Adjust viewport_fraction to see more/fewer items"),
                             ft.Text("• Enable scroll_events to see position data in console"),
                             ft.Text("• Change scroll_direction to vertical for different layouts"),
+                            ft.Text("• Toggle the indicator, keyboard navigation or schedule: the page is kept"),
                             ft.Text("• Experiment with different animation curves for auto-play"),
                         ], spacing=5),
                         bgcolor=ft.Colors.BLUE_50,
@@ -3,13 +3,36 @@ from flet_carousel_slider.flet_carousel_slider import (
     CarouselPageChangedReason,
     CenterPageEnlargeStrategy,
     ScrollDirection,
+    CarouselSyncMode,
+    CarouselHydrate,
+    CarouselIndicator,
+    IndicatorStyle,
+    IndicatorPosition,
 )
+from flet_carousel_slider.flet_carousel_grid import FletCarouselGrid
+from flet_carousel_slider.asset_image import CarouselAssetImage
+from flet_carousel_slider.image_source import CarouselImageSource
+from flet_carousel_slider.shared_slides import SharedSlides
+from flet_carousel_slider.recorder import CarouselRecorder, CarouselReplayer
+from flet_carousel_slider.traffic import CarouselTraffic
 from flet.core.animation import AnimationCurve
 
 __all__ = [
     "FletCarouselSlider",
+    "FletCarouselGrid",
     "CarouselPageChangedReason",
     "CenterPageEnlargeStrategy",
     "ScrollDirection",
+    "CarouselSyncMode",
+    "CarouselHydrate",
+    "CarouselIndicator",
+    "IndicatorStyle",
+    "IndicatorPosition",
+    "CarouselImageSource",
+    "CarouselAssetImage",
+    "SharedSlides",
+    "CarouselTraffic",
+    "CarouselRecorder",
+    "CarouselReplayer",
     "AnimationCurve",
 ]
\ No newline at end of file
@@ -0,0 +1,165 @@
+import hashlib
+import weakref
+from typing import Any, Dict, Iterable, Optional
+
+from flet.core.constrained_control import ConstrainedControl
+from flet.core.control import Control, OptionalNumber
+from flet.core.types import ImageFit
+
+
+class CarouselAssetImage(ConstrainedControl):
+    """
+    An image whose base64 payload is sent once per session and shared by hash.
+
+    Use it instead of `ft.Image(src_base64=...)` inside carousel items. The
+    enclosing FletCarouselSlider collects the payloads of all asset images in
+    its items and sends each unique one to the client only once per session.
+    Every slide then references the image by its content hash, and the client
+    keeps a single decoded copy in a shared cache.
+
+    Examples:
+        ```python
+        logo = open("logo.b64").read()
+
+        carousel = FletCarouselSlider(
+            items=[
+                ft.Column([CarouselAssetImage(logo, height=40), ft.Text(name)])
+                for name in names
+            ],
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        src_base64: str,
+        fit: Optional[ImageFit] = None,
+        semantics_label: Optional[str] = None,
+        #
+        # Control
+        #
+        opacity: OptionalNumber = None,
+        tooltip: Optional[str] = None,
+        visible: Optional[bool] = None,
+        data: Any = None,
+        #
+        # ConstrainedControl
+        #
+        width: OptionalNumber = None,
+        height: OptionalNumber = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            tooltip=tooltip,
+            opacity=opacity,
+            visible=visible,
+            data=data,
+            width=width,
+            height=height,
+        )
+
+        self.src_base64 = src_base64
+        self.fit = fit
+        self.semantics_label = semantics_label
+
+    def _get_control_name(self):
+        return "flet_carousel_asset_image"
+
+    # src_base64 property
+    @property
+    def src_base64(self) -> str:
+        """
+        Base64 encoded image. Only its hash is sent with the control itself.
+        """
+        return self.__src_base64
+
+    @src_base64.setter
+    def src_base64(self, value: str):
+        self.__src_base64 = value
+        self._set_attr("assetId", asset_id(value))
+
+    # asset_id property
+    @property
+    def asset_id(self) -> str:
+        """
+        Content hash identifying the image in the shared client cache.
+        """
+        return self._get_attr("assetId")
+
+    # fit property
+    @property
+    def fit(self) -> Optional[ImageFit]:
+        """
+        How the image should be inscribed into the space allocated during layout.
+        """
+        return self.__fit
+
+    @fit.setter
+    def fit(self, value: Optional[ImageFit]):
+        self.__fit = value
+        self._set_enum_attr("fit", value, ImageFit)
+
+    # semantics_label property
+    @property
+    def semantics_label(self) -> Optional[str]:
+        """
+        A semantic description of the image.
+        """
+        return self._get_attr("semanticsLabel")
+
+    @semantics_label.setter
+    def semantics_label(self, value: Optional[str]):
+        self._set_attr("semanticsLabel", value)
+
+
+def asset_id(src_base64: str) -> str:
+    """
+    Returns the content hash used to reference a base64 image payload.
+    """
+    return hashlib.sha256(src_base64.encode("ascii")).hexdigest()[:32]
+
+
+def collect_assets(controls: Iterable[Control]) -> Dict[str, str]:
+    """
+    Returns a map of asset id -> base64 payload for every CarouselAssetImage
+    found in `controls` and their descendants.
+    """
+    assets = {}
+    stack = list(controls)
+    while stack:
+        control = stack.pop()
+        if control is None:
+            continue
+        if isinstance(control, CarouselAssetImage):
+            assets.setdefault(control.asset_id, control.src_base64)
+        stack.extend(control._get_children())
+    return assets
+
+
+class AssetRegistry:
+    """
+    Tracks which asset payloads were already sent to each session.
+    """
+
+    def __init__(self):
+        self.__sent = weakref.WeakKeyDictionary()
+
+    def unsent(self, page, assets: Dict[str, str]) -> Dict[str, str]:
+        """
+        Returns the subset of `assets` not yet sent to `page` and marks them sent.
+        """
+        sent = self.__sent.setdefault(page, set())
+        new_assets = {k: v for k, v in assets.items() if k not in sent}
+        sent.update(new_assets)
+        return new_assets
+
+    def retain(self, page, asset_ids: Iterable[str]):
+        """
+        Forgets every asset sent to `page` that its client no longer holds.
+        """
+        sent = self.__sent.get(page)
+        if sent is not None:
+            sent.intersection_update(asset_ids)
+
+
+session_assets = AssetRegistry()
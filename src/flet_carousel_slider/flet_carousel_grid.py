@@ -0,0 +1,266 @@
+import json
+from typing import Any, List, Optional
+
+from flet.core.animation import AnimationValue
+from flet.core.constrained_control import ConstrainedControl
+from flet.core.control import Control, OptionalNumber
+from flet.core.types import OptionalControlEventCallable
+
+from flet_carousel_slider.flet_carousel_slider import EventData
+
+
+class FletCarouselGrid(ConstrainedControl):
+    """
+    A two-dimensional carousel: swipe vertically between rows and
+    horizontally between the cells of a row.
+
+    Use it instead of a vertical FletCarouselSlider whose items are horizontal
+    carousels. Both axes are virtualized by the client, so only the visible
+    cells are built, and the whole grid has a single controller and a single
+    `(row, column)` event stream.
+
+    Examples:
+        ```python
+        grid = FletCarouselGrid(
+            rows=[[poster(movie) for movie in genre.movies] for genre in genres],
+            height=400,
+            on_cell_changed=lambda data: print(data.row, data.column),
+        )
+        grid.animate_to(2, 5)
+        ```
+    """
+
+    def __init__(
+        self,
+        rows: Optional[List[List[Control]]] = None,
+        #
+        # Control
+        #
+        opacity: OptionalNumber = None,
+        tooltip: Optional[str] = None,
+        visible: Optional[bool] = None,
+        data: Any = None,
+        #
+        # ConstrainedControl
+        #
+        left: OptionalNumber = None,
+        top: OptionalNumber = None,
+        right: OptionalNumber = None,
+        bottom: OptionalNumber = None,
+        #
+        # FletCarouselGrid specific
+        #
+        height: OptionalNumber = None,
+        aspect_ratio: OptionalNumber = 16 / 9,
+        viewport_fraction: OptionalNumber = 0.8,
+        initial_row: Optional[int] = 0,
+        initial_column: Optional[int] = 0,
+        on_cell_changed: OptionalControlEventCallable = None,
+    ):
+        ConstrainedControl.__init__(
+            self,
+            tooltip=tooltip,
+            opacity=opacity,
+            visible=visible,
+            data=data,
+            left=left,
+            top=top,
+            right=right,
+            bottom=bottom,
+        )
+
+        self.rows = rows
+        self.height = height
+        self.aspect_ratio = aspect_ratio
+        self.viewport_fraction = viewport_fraction
+        self.initial_row = initial_row
+        self.initial_column = initial_column
+
+        self.__on_cell_changed_handler = None
+        self.on_cell_changed = on_cell_changed
+        self._add_event_handler("cell_changed", self._on_cell_changed_internal)
+
+    def _get_control_name(self):
+        return "flet_carousel_grid"
+
+    def _get_children(self):
+        """
+        Returns the cells of all rows, tagged with their position.
+        """
+        children = []
+        for r, row in enumerate(self.rows):
+            for c, cell in enumerate(row):
+                if cell is not None:
+                    cell._set_attr_internal("n", f"cell_{r}_{c}")
+                    children.append(cell)
+        return children
+
+    # rows property
+    @property
+    def rows(self) -> List[List[Control]]:
+        """
+        Rows of cells. Rows may have different lengths.
+        """
+        return self.__rows
+
+    @rows.setter
+    def rows(self, value: Optional[List[List[Control]]]):
+        self.__rows = value or []
+
+    # height property
+    @property
+    def height(self) -> OptionalNumber:
+        """
+        Set grid height and overrides any existing aspect_ratio.
+        """
+        return self._get_attr("height")
+
+    @height.setter
+    def height(self, value: OptionalNumber):
+        self._set_attr("height", value)
+
+    # aspect_ratio property
+    @property
+    def aspect_ratio(self) -> OptionalNumber:
+        """
+        Aspect ratio is used if no height have been declared.
+        Defaults to 16/9.
+        """
+        return self._get_attr("aspectRatio")
+
+    @aspect_ratio.setter
+    def aspect_ratio(self, value: OptionalNumber):
+        self._set_attr("aspectRatio", value)
+
+    # viewport_fraction property
+    @property
+    def viewport_fraction(self) -> OptionalNumber:
+        """
+        The fraction of the row width that each cell should occupy.
+        Defaults to 0.8.
+        """
+        return self._get_attr("viewportFraction")
+
+    @viewport_fraction.setter
+    def viewport_fraction(self, value: OptionalNumber):
+        self._set_attr("viewportFraction", value)
+
+    # initial_row property
+    @property
+    def initial_row(self) -> Optional[int]:
+        """
+        The row to show when first creating the grid.
+        """
+        return self._get_attr("initialRow")
+
+    @initial_row.setter
+    def initial_row(self, value: Optional[int]):
+        self._set_attr("initialRow", value)
+
+    # initial_column property
+    @property
+    def initial_column(self) -> Optional[int]:
+        """
+        The column to show in the initial row when first creating the grid.
+        """
+        return self._get_attr("initialColumn")
+
+    @initial_column.setter
+    def initial_column(self, value: Optional[int]):
+        self._set_attr("initialColumn", value)
+
+    # Internal event handlers for JSON decoding
+    def _on_cell_changed_internal(self, e):
+        """Internal handler that decodes JSON and calls user handler."""
+        if self.__on_cell_changed_handler:
+            try:
+                data_dict = json.loads(e.data) if isinstance(e.data, str) else e.data
+                self.__on_cell_changed_handler(EventData(data_dict))
+            except (json.JSONDecodeError, AttributeError):
+                self.__on_cell_changed_handler(EventData({}))
+
+    # Event handlers
+    @property
+    def on_cell_changed(self) -> OptionalControlEventCallable:
+        """
+        Called whenever the visible cell changes.
+
+        Args:
+            data (EventData): Event data object with attribute and dict-style access:
+                - data.row (int): The current row
+                - data.column (int): The current column within that row
+
+        Example:
+            def on_cell_changed(data):
+                print(f"Cell: ({data.row}, {data.column})")
+
+            grid.on_cell_changed = on_cell_changed
+        """
+        return self.__on_cell_changed_handler
+
+    @on_cell_changed.setter
+    def on_cell_changed(self, handler: OptionalControlEventCallable):
+        self.__on_cell_changed_handler = handler
+
+    # Controller methods
+    def jump_to(self, row: int, column: int = 0):
+        """
+        Jump to the given cell without animation.
+
+        Args:
+            row: The row index
+            column: The column index within the row
+        """
+        args = {"row": str(row), "column": str(column)}
+        return self.invoke_method("jump_to", args, wait_for_result=False)
+
+    def animate_to(
+        self, row: int, column: int = 0, animation: Optional[AnimationValue] = None
+    ):
+        """
+        Animate to the given cell.
+
+        Args:
+            row: The row index
+            column: The column index within the row
+            animation: Animation configuration. Can be:
+                - None: Use default animation (300ms, linear)
+                - bool: True for default, False for no animation
+                - int: Duration in milliseconds with default curve
+                - Animation: Full animation object with duration and curve
+        """
+        duration = 300
+        curve = "linear"
+
+        if animation is None:
+            pass  # Use defaults
+        elif isinstance(animation, bool):
+            if not animation:
+                duration = 0  # No animation
+        elif isinstance(animation, int):
+            duration = animation
+        elif hasattr(animation, "duration") and hasattr(animation, "curve"):
+            duration = animation.duration or 300
+            if hasattr(animation.curve, "value"):
+                curve = animation.curve.value
+            elif animation.curve:
+                curve = str(animation.curve)
+
+        args = {
+            "row": str(row),
+            "column": str(column),
+            "duration": str(duration),
+            "curve": curve,
+        }
+        return self.invoke_method("animate_to", args, wait_for_result=False)
+
+    def get_current_cell(self):
+        """
+        Get the current cell.
+
+        Returns:
+            A (row, column) tuple
+        """
+        result = self.invoke_method("get_current_cell", {}, wait_for_result=True)
+        cell = json.loads(result) if result else {}
+        return cell.get("row", 0), cell.get("column", 0)
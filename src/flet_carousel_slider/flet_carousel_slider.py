@@ -1,6 +1,14 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Sequence, Union
+import collections.abc
+import copy
 import json
+import logging
+import threading
+import typing
 import uuid
 
 from flet.core.constrained_control import ConstrainedControl
@@ -8,9 +16,36 @@ from flet.core.control import OptionalNumber, Control
 from flet.core.types import (
     OptionalControlEventCallable,
     ClipBehavior,
+    ColorValue,
 )
 from flet.core.animation import AnimationValue
 
+from flet_carousel_slider.asset_image import collect_assets, session_assets
+from flet_carousel_slider.image_source import CarouselImageSource
+from flet_carousel_slider.item_template import (
+    bind_control,
+    reconcile_controls,
+    render_row,
+)
+from flet_carousel_slider.shared_slides import SharedSlides
+from flet_carousel_slider.recorder import CarouselRecorder
+from flet_carousel_slider.traffic import CarouselTraffic, track_nested_updates
+
+logger = logging.getLogger("flet_carousel_slider")
+
+# Child names shared by every carousel, instead of one string per item each
+_ITEM_NAMES: List[str] = []
+_ITEM_NAMES_LOCK = threading.Lock()
+
+
+def _item_name(index: int) -> str:
+    if index >= len(_ITEM_NAMES):
+        with _ITEM_NAMES_LOCK:
+            _ITEM_NAMES.extend(
+                f"item_{i}" for i in range(len(_ITEM_NAMES), index + 1)
+            )
+    return _ITEM_NAMES[index]
+
 
 class EventData:
     """
@@ -96,6 +131,143 @@ class ScrollDirection(Enum):
     VERTICAL = "vertical"
 
 
+class CarouselSyncMode(Enum):
+    """
+    Enum for how linked carousels follow each other.
+    """
+
+    ANIMATE = "animate"
+    JUMP = "jump"
+
+
+class CarouselHydrate(Enum):
+    """
+    Enum for when a carousel sends its items.
+    """
+
+    EAGER = "eager"
+    VISIBLE = "visible"
+
+
+class IndicatorStyle(Enum):
+    """
+    Enum for page indicator style.
+    """
+
+    DOTS = "dots"
+    EXPANDING = "expanding"
+    FRACTION = "fraction"
+
+
+class IndicatorPosition(Enum):
+    """
+    Enum for page indicator position.
+    """
+
+    BOTTOM = "bottom"
+    TOP = "top"
+    OVERLAY_BOTTOM = "overlayBottom"
+    OVERLAY_TOP = "overlayTop"
+
+
+@dataclass
+class CarouselIndicator:
+    """
+    Page indicator rendered by the client from the current page.
+
+    Dots are drawn and updated without server messages, and tapping a dot
+    navigates locally.
+
+    Examples:
+        ```python
+        carousel.indicator = CarouselIndicator(
+            active_color=ft.Colors.BLUE,
+            max_visible_dots=7,
+        )
+        ```
+    """
+
+    style: Optional[IndicatorStyle] = IndicatorStyle.DOTS
+    position: Optional[IndicatorPosition] = IndicatorPosition.BOTTOM
+    color: Optional[ColorValue] = None
+    active_color: Optional[ColorValue] = None
+    size: OptionalNumber = 8
+    spacing: OptionalNumber = 8
+    max_visible_dots: Optional[int] = None
+
+
+_OPTION_CHECKS = {
+    "viewport_fraction": (lambda v: 0 < v <= 1, "must be in (0, 1]"),
+    "aspect_ratio": (lambda v: v > 0, "must be positive"),
+    "height": (lambda v: v > 0, "must be positive"),
+    "enlarge_factor": (lambda v: 0 <= v <= 1, "must be in [0, 1]"),
+    "auto_play_interval": (lambda v: v > 0, "must be positive"),
+    "auto_play_ready_timeout": (lambda v: v >= 0, "must not be negative"),
+    "initial_page": (lambda v: v >= 0, "must not be negative"),
+    "items_per_page": (lambda v: v >= 1, "must be at least 1"),
+    "keep_alive_pages": (lambda v: v >= 0, "must not be negative"),
+    "prefetch_pages": (lambda v: v >= 0, "must not be negative"),
+    "request_more_threshold": (lambda v: v >= 0, "must not be negative"),
+    "request_more_count": (lambda v: v >= 1, "must be at least 1"),
+    "progressive_chunk_size": (lambda v: v >= 1, "must be at least 1"),
+}
+
+
+def _check_option(name: str, value: Any, hint: Any) -> Any:
+    """
+    Returns `value` checked against the setter annotation `hint` of option
+    `name`, with an enum's raw value converted to the enum member.
+
+    Raises TypeError if the value has the wrong type, or ValueError if it is
+    not one of the values of the option's enum.
+    """
+    enums = [
+        t
+        for t in typing.get_args(hint) or (hint,)
+        if isinstance(t, type) and issubclass(t, Enum)
+    ]
+    if enums and not isinstance(value, Enum) and isinstance(value, str):
+        for enum in enums:
+            for member in enum:
+                if member.value == value:
+                    return member
+        allowed = [m.value for e in enums for m in e]
+        raise ValueError(f"{name} must be one of {allowed}, got {value!r}")
+    if not _matches_hint(value, hint):
+        expected = str(hint).replace("typing.", "")
+        raise TypeError(f"{name} must be {expected}, got {value!r}")
+    return value
+
+
+def _matches_hint(value: Any, hint: Any) -> bool:
+    if hint is Any or isinstance(hint, typing.TypeVar):
+        return True
+    if hint is type(None):
+        return value is None
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin is Union:
+        return any(_matches_hint(value, arg) for arg in args)
+    if origin is collections.abc.Callable:
+        return callable(value)
+    if origin in (list, tuple):
+        if not isinstance(value, (list, tuple)):
+            return False
+        if origin is list and args:
+            return all(_matches_hint(v, args[0]) for v in value)
+        return True
+    if origin is not None:
+        return not isinstance(origin, type) or isinstance(value, origin)
+    if not isinstance(hint, type):
+        return True
+    if hint in (int, float):
+        # bool is an int, but True is not a number of pages
+        if isinstance(value, bool):
+            return False
+        return isinstance(value, int) or (hint is float and isinstance(value, float))
+    return isinstance(value, hint)
+
+
 class FletCarouselSlider(ConstrainedControl):
     """
     A powerful Flet control that wraps the Flutter carousel_slider package.
@@ -109,7 +281,7 @@ class FletCarouselSlider(ConstrainedControl):
         - Infinite scroll support
         - Vertical and horizontal scrolling
         - Page change and scroll event callbacks
-        - Real-time parameter updates
+        - Real-time parameter updates without recreating the control
         - Native Flutter performance
 
     Examples:
@@ -177,7 +349,15 @@ class FletCarouselSlider(ConstrainedControl):
         #
         # FletCarouselSlider specific
         #
-        items: Optional[List[Control]] = None,
+        items: Optional[Union[List[Control], SharedSlides]] = None,
+        item_template: Optional[Control] = None,
+        item_data: Optional[List[Dict[str, Any]]] = None,
+        items_per_page: Optional[int] = 1,
+        reconcile_items: bool = False,
+        progressive: bool = False,
+        progressive_chunk_size: int = 4,
+        hydrate: Optional[CarouselHydrate] = CarouselHydrate.EAGER,
+        release_on_unmount: bool = False,
         height: OptionalNumber = None,
         aspect_ratio: OptionalNumber = 16 / 9,
         viewport_fraction: OptionalNumber = 0.8,
@@ -188,6 +368,9 @@ class FletCarouselSlider(ConstrainedControl):
         auto_play: Optional[bool] = False,
         auto_play_interval: Optional[int] = 4000,  # milliseconds
         auto_play_animation: Optional[AnimationValue] = None,
+        auto_play_schedule: Optional[List[int]] = None,
+        auto_play_wait_for_ready: Optional[bool] = False,
+        auto_play_ready_timeout: Optional[int] = 3000,  # milliseconds
         enlarge_center_page: Optional[bool] = False,
         enlarge_factor: OptionalNumber = 0.3,
         enlarge_strategy: Optional[
@@ -202,8 +385,22 @@ class FletCarouselSlider(ConstrainedControl):
         pad_ends: Optional[bool] = True,
         clip_behavior: Optional[ClipBehavior] = ClipBehavior.HARD_EDGE,
         enable_scroll_events: Optional[bool] = False,
+        prefetch_pages: Optional[int] = 0,
+        keep_alive_pages: Optional[int] = 0,
+        request_more_threshold: Optional[int] = 0,
+        request_more_count: Optional[int] = 10,
+        sync_group: Optional[str] = None,
+        sync_mode: Optional[CarouselSyncMode] = CarouselSyncMode.ANIMATE,
+        sync_on_tap: Optional[bool] = False,
+        indicator: Optional[CarouselIndicator] = None,
+        keyboard_navigation: Optional[bool] = False,
+        autofocus: Optional[bool] = False,
         on_page_changed: OptionalControlEventCallable = None,
         on_scrolled: OptionalControlEventCallable = None,
+        on_prefetch: OptionalControlEventCallable = None,
+        on_request_more: OptionalControlEventCallable = None,
+        on_auto_play_delayed: OptionalControlEventCallable = None,
+        on_hydrate: OptionalControlEventCallable = None,
     ):
         ConstrainedControl.__init__(
             self,
@@ -217,7 +414,34 @@ class FletCarouselSlider(ConstrainedControl):
             bottom=bottom,
         )
 
+        self.__traffic = CarouselTraffic()
+        self.__recorder = None
+        # Nesting depth of batch() blocks; updates are deferred while > 0
+        self.__batch_depth = 0
+        # Last serialized value of each JSON attribute, for dirty tracking
+        self.__json_snapshots = {}
+        # Indexes of items not sent yet; the client shows skeletons for them
+        self.__withheld = set()
+        self.__stream_order = []
+        self.__slots = False
+        self.__hydrated = False
+        self.__released = False
+        # Factory slides finished while an update was in flight
+        self.__built_lock = threading.Lock()
+        self.__flushing_built = False
+        self.__built_dirty = False
+
+        self.reconcile_items = reconcile_items
+        self.progressive = progressive
+        self.progressive_chunk_size = progressive_chunk_size
+        self.hydrate = hydrate
+        self.release_on_unmount = release_on_unmount
         self.items = items or []
+        self.__item_data = []
+        self.__item_template = None
+        self.item_template = item_template
+        self.item_data = item_data
+        self.items_per_page = items_per_page
         self.height = height
         self.aspect_ratio = aspect_ratio
         self.viewport_fraction = viewport_fraction
@@ -228,6 +452,9 @@ class FletCarouselSlider(ConstrainedControl):
         self.auto_play = auto_play
         self.auto_play_interval = auto_play_interval
         self.auto_play_animation = auto_play_animation
+        self.auto_play_schedule = auto_play_schedule
+        self.auto_play_wait_for_ready = auto_play_wait_for_ready
+        self.auto_play_ready_timeout = auto_play_ready_timeout
         self.enlarge_center_page = enlarge_center_page
         self.enlarge_factor = enlarge_factor
         self.enlarge_strategy = enlarge_strategy
@@ -240,20 +467,242 @@ class FletCarouselSlider(ConstrainedControl):
         self.pad_ends = pad_ends
         self.clip_behavior = clip_behavior
         self.enable_scroll_events = enable_scroll_events
+        self.prefetch_pages = prefetch_pages
+        self.keep_alive_pages = keep_alive_pages
+        self.request_more_threshold = request_more_threshold
+        self.request_more_count = request_more_count
+        self.sync_group = sync_group
+        self.sync_mode = sync_mode
+        self.sync_on_tap = sync_on_tap
+        self.indicator = indicator
+        self.keyboard_navigation = keyboard_navigation
+        self.autofocus = autofocus
+        # Start indexes of on_request_more ranges not yet fulfilled
+        self.__pending_more = set()
         # Initialize handler variables
         self.__on_page_changed_handler = None
         self.__on_scrolled_handler = None
+        self.__on_prefetch_handler = None
+        self.__on_request_more_handler = None
+        self.__on_auto_play_delayed_handler = None
 
         self.on_page_changed = on_page_changed
         self.on_scrolled = on_scrolled
+        self.on_prefetch = on_prefetch
+        self.on_request_more = on_request_more
+        self.on_auto_play_delayed = on_auto_play_delayed
+        self.__on_hydrate_handler = None
+        self.on_hydrate = on_hydrate
 
         # Add internal event handlers for JSON decoding
         self._add_event_handler("page_changed", self._on_page_changed_internal)
         self._add_event_handler("scrolled", self._on_scrolled_internal)
+        self._add_event_handler("prefetch", self._on_prefetch_internal)
+        self._add_event_handler("request_more", self._on_request_more_internal)
+        self._add_event_handler(
+            "auto_play_delayed", self._on_auto_play_delayed_internal
+        )
+        self._add_event_handler("resync", self._on_resync_internal)
+        self._add_event_handler("hydrate", self._on_hydrate_internal)
 
     def before_update(self):
         super().before_update()
-        self._set_attr_json("autoPlayAnimation", self.__auto_play_animation)
+        if self.progressive and self.uid is None and not self.__stream_order:
+            self.__withhold_distant_items()
+        slots = self.__slots or self.__awaiting_hydration()
+        self._set_attr("itemCount", len(self.items) if slots else None)
+        self._set_json_if_changed("autoPlayAnimation", self.__auto_play_animation)
+        self._set_json_if_changed("indicator", self.__indicator)
+        self._set_json_if_changed("autoPlaySchedule", self.__auto_play_schedule or None)
+        # Send each CarouselAssetImage payload only once per session, with
+        # the update that sends the first slide using it. A carousel waiting
+        # to hydrate sends no slides, so no payloads either; held-back
+        # progressive slides bring theirs with their chunk
+        if self.page and not self.__awaiting_hydration():
+            new_assets = session_assets.unsent(
+                self.page, collect_assets(self._get_children())
+            )
+            if new_assets:
+                self._set_attr_json("assets", new_assets)
+
+    def will_unmount(self):
+        super().will_unmount()
+        # A control moved within the page is removed and re-added in one update
+        moved = self.page is not None and self.page.get_control(self.uid) is self
+        if moved:
+            return
+        self.__release_caches()
+        if self.release_on_unmount:
+            self.__release()
+
+    def __release_caches(self):
+        """
+        Drops what the carousel rebuilds on its next add: JSON snapshots,
+        the previous children and the recorder.
+        """
+        self.recorder = None
+        self.__json_snapshots.clear()
+        self._previous_children.clear()
+
+    def __release(self):
+        """
+        Drops every reference the carousel holds, so a removed carousel
+        kept alive by application code does not keep its slides alive.
+        """
+        self.__released = True
+        self.__items = []
+        self.__item_data = []
+        self.__item_template = None
+        self.__withheld.clear()
+        self.__stream_order = []
+        self.__pending_more.clear()
+        self.__on_page_changed_handler = None
+        self.__on_scrolled_handler = None
+        self.__on_prefetch_handler = None
+        self.__on_request_more_handler = None
+        self.__on_auto_play_delayed_handler = None
+        self.__on_hydrate_handler = None
+
+    def did_mount(self):
+        super().did_mount()
+        track_nested_updates(self.page)
+        if self.__released and not self.items:
+            logger.warning(
+                "A carousel released on removal was added again without new "
+                "items; set release_on_unmount=False to re-add the same instance"
+            )
+        self.__released = False
+        if self.__awaiting_hydration():
+            return
+        if self.progressive and self.__withheld:
+            self.page.run_thread(self.__stream_items)
+        # Factory slides finished while the carousel was being added
+        if any(
+            item is not None and item.uid is None and i not in self.__withheld
+            for i, item in enumerate(self.items)
+        ):
+            self.update()
+
+    def __awaiting_hydration(self) -> bool:
+        return self.hydrate == CarouselHydrate.VISIBLE and not self.__hydrated
+
+    def __nearest_first(self, count: int) -> List[int]:
+        """
+        Returns item indexes ordered by distance from the initial page.
+        """
+        per_page = max(1, self.items_per_page or 1)
+        center = (self.initial_page or 0) * per_page
+
+        def distance(i):
+            d = abs(i - center)
+            return min(d, count - d) if self.enable_infinite_scroll else d
+
+        return sorted(range(count), key=distance)
+
+    def __withhold_distant_items(self):
+        """
+        Withholds every item but the initial page and its neighbours, and
+        orders the rest by distance from the initial page.
+        """
+        per_page = max(1, self.items_per_page or 1)
+        order = self.__nearest_first(len(self.items))
+        self.__stream_order = order[3 * per_page :]
+        self.__withheld = set(self.__stream_order)
+        self.__slots = True
+
+    def __stream_items(self):
+        """
+        Sends the withheld items in chunks, nearest to the initial page first.
+        Every update diffs all children, so each chunk is twice the size of
+        the previous one to keep the number of updates logarithmic.
+        """
+        order = [i for i in self.__stream_order if i in self.__withheld]
+        start, size = 0, max(1, self.progressive_chunk_size)
+        while start < len(order):
+            if not self.page:
+                return
+            self.__withheld.difference_update(order[start : start + size])
+            self.update()
+            start += size
+            size *= 2
+
+    def _set_json_if_changed(self, name: str, value: Any):
+        """
+        Serialize a JSON attribute only if its value changed since the last update.
+        """
+        if name in self.__json_snapshots and self.__json_snapshots[name] == value:
+            return
+        self.__json_snapshots[name] = copy.deepcopy(value)
+        self._set_attr_json(name, value)
+
+    def _update_if_mounted(self):
+        """
+        Send pending changes now, unless inside a batch() block.
+        """
+        if self.__batch_depth == 0 and self.page:
+            self.update()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group property changes into a single update.
+
+        Updates that methods like append_items() or the on_scrolled setter
+        would send on their own are deferred, and exactly one update with
+        the combined diff is sent when the outermost block exits.
+
+        Examples:
+            with carousel.batch():
+                carousel.viewport_fraction = 0.6
+                carousel.items_per_page = 2
+                carousel.on_scrolled = on_scrolled
+        """
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+        self._update_if_mounted()
+
+    def configure(self, **options):
+        """
+        Validate and apply several options at once with a single update.
+
+        All options are validated against their types and ranges before any
+        is applied, so an invalid value leaves the carousel unchanged. Enum
+        options also accept their raw values, e.g. scroll_direction="vertical".
+
+        Args:
+            **options: Property names and values, e.g. viewport_fraction=0.6
+
+        Raises:
+            AttributeError: If an option is not a settable property
+            TypeError: If a value does not have the option's type
+            ValueError: If a value is out of range or not one of the option's
+                enum values
+
+        Examples:
+            carousel.configure(viewport_fraction=0.6, auto_play=True)
+        """
+        for name, value in options.items():
+            prop = getattr(type(self), name, None)
+            if not isinstance(prop, property) or prop.fset is None:
+                raise AttributeError(
+                    f"{type(self).__name__} has no settable option '{name}'"
+                )
+            try:
+                hints = typing.get_type_hints(prop.fset)
+            except NameError:
+                hints = {}
+            hint = next((h for arg, h in hints.items() if arg != "return"), Any)
+            value = options[name] = _check_option(name, value, hint)
+            check = _OPTION_CHECKS.get(name)
+            if value is not None and check and not check[0](value):
+                raise ValueError(f"{name} {check[1]}, got {value!r}")
+
+        with self.batch():
+            for name, value in options.items():
+                setattr(self, name, value)
 
     def _get_control_name(self):
         return "flet_carousel_slider"
@@ -263,23 +712,243 @@ class FletCarouselSlider(ConstrainedControl):
         Returns the list of child controls (carousel items).
         """
         children = []
+        if self.__awaiting_hydration():
+            return children
         for i, item in enumerate(self.items):
-            if item is not None:
-                item._set_attr_internal("n", f"item_{i}")
+            if item is not None and i not in self.__withheld:
+                item._set_attr_internal("n", _item_name(i))
                 children.append(item)
         return children
 
+    def build_update_commands(
+        self, index, commands, added_controls, removed_controls, isolated=False
+    ):
+        start = len(commands)
+        super().build_update_commands(
+            index, commands, added_controls, removed_controls, isolated
+        )
+        if len(commands) > start:
+            self.__traffic.record_update(self.uid, commands[start:])
+            if self.__recorder:
+                self.__recorder.record_update(commands[start:])
+
+    def _build_add_commands(self, indent=0, index=None, added_controls=None):
+        commands = super()._build_add_commands(indent, index, added_controls)
+        self.__traffic.record_add(commands)
+        return commands
+
+    # traffic property
+    @property
+    def traffic(self) -> CarouselTraffic:
+        """
+        Wire-traffic counters of this carousel: commands sent for its
+        attributes and children (including updates of single slides),
+        controller calls and incoming events.
+        """
+        return self.__traffic
+
+    # recorder property
+    @property
+    def recorder(self) -> Optional[CarouselRecorder]:
+        """
+        A CarouselRecorder capturing this carousel's incoming events,
+        controller calls and update diffs to a trace file that
+        CarouselReplayer can replay. Set to None to stop recording.
+        """
+        return self.__recorder
+
+    @recorder.setter
+    def recorder(self, value: Optional[CarouselRecorder]):
+        if self.__recorder:
+            self.__recorder.detach(self)
+        self.__recorder = value
+        if value:
+            value.attach(self)
+
     # items property
     @property
     def items(self) -> List[Control]:
         """
         List of widgets to be displayed in the carousel.
+        Can also be set to SharedSlides, which are cloned for this carousel.
         """
         return self.__items
 
     @items.setter
-    def items(self, value: Optional[List[Control]]):
-        self.__items = value or []
+    def items(self, value: Optional[Union[List[Control], SharedSlides]]):
+        if isinstance(value, SharedSlides):
+            value = value.materialize()
+        value = value or []
+        if self.page and self.reconcile_items:
+            value = reconcile_controls(self.__items, value)
+        self.__items = value
+
+    # reconcile_items property
+    @property
+    def reconcile_items(self) -> bool:
+        """
+        Whether assigning a new items list on a live carousel reuses the
+        controls already shown for slides that did not change, so only new or
+        changed slides are sent. Defaults to False.
+
+        Reused instances replace the caller's objects in `items`: they take
+        event handlers and `data` from the new controls, but the new controls
+        themselves are never added to the page. Calling `update()` or setting
+        `on_*` on a reference kept to one of them has no effect on screen (or
+        fails); read `carousel.items[i]` after assigning instead.
+        """
+        return self.__reconcile_items
+
+    @reconcile_items.setter
+    def reconcile_items(self, value: bool):
+        self.__reconcile_items = bool(value)
+
+    # progressive property
+    @property
+    def progressive(self) -> bool:
+        """
+        Whether the first update carries only the slides of the initial page
+        and its neighbours, with the rest streamed in chunks nearest first.
+        The client shows skeleton slides until they arrive, so time to first
+        slide does not depend on the size of the whole carousel.
+        Defaults to False.
+        """
+        return self.__progressive
+
+    @progressive.setter
+    def progressive(self, value: bool):
+        self.__progressive = bool(value)
+
+    # progressive_chunk_size property
+    @property
+    def progressive_chunk_size(self) -> int:
+        """
+        Number of slides in the first update while streaming in progressive
+        mode. Each following update sends twice as many. Defaults to 4.
+        """
+        return self.__progressive_chunk_size
+
+    @progressive_chunk_size.setter
+    def progressive_chunk_size(self, value: int):
+        self.__progressive_chunk_size = value
+
+    # hydrate property
+    @property
+    def hydrate(self) -> Optional[CarouselHydrate]:
+        """
+        When the carousel sends its items. With CarouselHydrate.VISIBLE the
+        first update carries only the carousel itself, shown as skeleton
+        slides, and the items are sent once it first scrolls into view.
+        Items can also be built late, in on_hydrate.
+        Defaults to CarouselHydrate.EAGER.
+        """
+        return self.__hydrate
+
+    @hydrate.setter
+    def hydrate(self, value: Optional[CarouselHydrate]):
+        if isinstance(value, str):
+            value = CarouselHydrate(value)
+        self.__hydrate = value
+        self._set_enum_attr("hydrate", value, CarouselHydrate)
+
+    # release_on_unmount property
+    @property
+    def release_on_unmount(self) -> bool:
+        """
+        Whether removing the carousel from the page also releases its items,
+        item data and event handlers, so a removed carousel that application
+        code still references does not keep its slides alive. A released
+        carousel needs new items and handlers before it is added again, and
+        adding it without them logs a warning. Caches and the recorder are
+        released on removal either way. Defaults to False, so the same
+        instance can be re-added, e.g. across route changes.
+        """
+        return self.__release_on_unmount
+
+    @release_on_unmount.setter
+    def release_on_unmount(self, value: bool):
+        self.__release_on_unmount = bool(value)
+
+    # item_template property
+    @property
+    def item_template(self) -> Optional[Control]:
+        """
+        Control used as a template for every row of item_data.
+
+        String properties of the template and its descendants may contain
+        `{field}` placeholders that are replaced with the row's values, e.g.
+        `ft.Text("{title}")` or `ft.Image(src="{image_url}")`. A row without
+        a field its placeholders name raises KeyError.
+        When set, items are generated from item_data, so it cannot be set
+        while the carousel holds items of its own: clear `items` first.
+        """
+        return self.__item_template
+
+    @item_template.setter
+    def item_template(self, value: Optional[Control]):
+        if value is not None and self.__item_template is None and self.items:
+            raise ValueError(
+                "item_template cannot be combined with items; pass the rows "
+                "as item_data instead"
+            )
+        self.__item_template = value
+        if value is not None:
+            self.items = [render_row(value, row) for row in self.__item_data]
+
+    # item_data property
+    @property
+    def item_data(self) -> List[Dict[str, Any]]:
+        """
+        Rows of data bound to item_template, one slide per row.
+
+        Reassigning the list re-binds existing slides in place, so only the
+        fields that actually changed are sent to the client.
+        """
+        return self.__item_data
+
+    @item_data.setter
+    def item_data(self, value: Optional[List[Dict[str, Any]]]):
+        self.__item_data = list(value or [])
+        template = self.__item_template
+        if template is None:
+            return
+        items = self.items[: len(self.__item_data)]
+        for item, row in zip(items, self.__item_data):
+            bind_control(template, item, row)
+        for row in self.__item_data[len(items) :]:
+            items.append(render_row(template, row))
+        self.items = items
+
+    def update_row(self, index: int, row: Dict[str, Any]):
+        """
+        Replace the data of a single templated slide.
+
+        Only the bound properties that changed are sent on the next update.
+
+        Args:
+            index: Index of the row in item_data
+            row: The new row data
+        """
+        self.__item_data[index] = row
+        bind_control(self.__item_template, self.items[index], row)
+        self._update_if_mounted()
+
+    # items_per_page property
+    @property
+    def items_per_page(self) -> Optional[int]:
+        """
+        Number of items shown side by side on each page.
+        Items are grouped on the client, so each one stays an individual
+        control and changing this value (e.g. at a responsive breakpoint)
+        re-groups the carousel without sending the items again.
+        Page indexes in events and controller methods refer to pages, not items.
+        Defaults to 1.
+        """
+        return self._get_attr("itemsPerPage")
+
+    @items_per_page.setter
+    def items_per_page(self, value: Optional[int]):
+        self._set_attr("itemsPerPage", value)
 
     # height property
     @property
@@ -324,6 +993,7 @@ class FletCarouselSlider(ConstrainedControl):
     def initial_page(self) -> Optional[int]:
         """
         The initial page to show when first creating the CarouselSlider.
+        Changing it on a live carousel jumps to that page.
         """
         return self._get_attr("initialPage")
 
@@ -413,6 +1083,54 @@ class FletCarouselSlider(ConstrainedControl):
     def auto_play_animation(self, value: Optional[AnimationValue]):
         self.__auto_play_animation = value
 
+    # auto_play_schedule property
+    @property
+    def auto_play_schedule(self) -> Optional[List[int]]:
+        """
+        Per-slide dwell times in milliseconds, used instead of auto_play_interval.
+        Slide `i` stays for `auto_play_schedule[i % len(auto_play_schedule)]`.
+        The schedule runs entirely on the client, so Python needs no timers to
+        advance slides.
+
+        Examples:
+        - auto_play_schedule=[8000, 3000, 3000]  # Long first slide
+        """
+        return self.__auto_play_schedule
+
+    @auto_play_schedule.setter
+    def auto_play_schedule(self, value: Optional[List[int]]):
+        self.__auto_play_schedule = value
+
+    # auto_play_wait_for_ready property
+    @property
+    def auto_play_wait_for_ready(self) -> Optional[bool]:
+        """
+        If true, the client loads the images of the next page's slides
+        during the current page, and auto play holds the transition until
+        they are loaded, up to auto_play_ready_timeout. This avoids animating
+        to blank or half-painted slides on slow storage. Covers ft.Image with
+        a URL or asset src and CarouselAssetImage; base64 and SVG images are
+        not waited for.
+        """
+        return self._get_attr("autoPlayWaitForReady")
+
+    @auto_play_wait_for_ready.setter
+    def auto_play_wait_for_ready(self, value: Optional[bool]):
+        self._set_attr("autoPlayWaitForReady", value)
+
+    # auto_play_ready_timeout property
+    @property
+    def auto_play_ready_timeout(self) -> Optional[int]:
+        """
+        Maximum time in milliseconds auto play waits for the next slide to be ready.
+        Defaults to 3000ms.
+        """
+        return self._get_attr("autoPlayReadyTimeout")
+
+    @auto_play_ready_timeout.setter
+    def auto_play_ready_timeout(self, value: Optional[int]):
+        self._set_attr("autoPlayReadyTimeout", value)
+
     # enlarge_center_page property
     @property
     def enlarge_center_page(self) -> Optional[bool]:
@@ -565,9 +1283,148 @@ class FletCarouselSlider(ConstrainedControl):
     def enable_scroll_events(self, value: Optional[bool]):
         self._set_attr("enableScrollEvents", value)
 
+    # prefetch_pages property
+    @property
+    def prefetch_pages(self) -> Optional[int]:
+        """
+        Number of pages ahead of the scroll position to request through on_prefetch.
+        The client widens the window in the direction of travel as the swipe
+        speeds up and drops pages behind it during fast flings.
+        Defaults to 0 (prefetch disabled).
+        """
+        return self._get_attr("prefetchPages")
+
+    @prefetch_pages.setter
+    def prefetch_pages(self, value: Optional[int]):
+        self._set_attr("prefetchPages", value)
+
+    # keep_alive_pages property
+    @property
+    def keep_alive_pages(self) -> Optional[int]:
+        """
+        Number of slides on each side of the current page whose state is kept
+        alive while offscreen, e.g. to avoid reloading video or web view slides.
+        Slides further away are released, furthest first, bounding memory use.
+        Defaults to 0 (carousel_slider's default behavior).
+        """
+        return self._get_attr("keepAlivePages")
+
+    @keep_alive_pages.setter
+    def keep_alive_pages(self, value: Optional[int]):
+        self._set_attr("keepAlivePages", value)
+
+    # request_more_threshold property
+    @property
+    def request_more_threshold(self) -> Optional[int]:
+        """
+        Fire on_request_more when the current page comes within this many pages
+        of the last loaded item. Defaults to 0 (disabled).
+        """
+        return self._get_attr("requestMoreThreshold")
+
+    @request_more_threshold.setter
+    def request_more_threshold(self, value: Optional[int]):
+        self._set_attr("requestMoreThreshold", value)
+
+    # request_more_count property
+    @property
+    def request_more_count(self) -> Optional[int]:
+        """
+        Number of items to ask for in each on_request_more event.
+        Defaults to 10.
+        """
+        return self._get_attr("requestMoreCount")
+
+    @request_more_count.setter
+    def request_more_count(self, value: Optional[int]):
+        self._set_attr("requestMoreCount", value)
+
+    # sync_group property
+    @property
+    def sync_group(self) -> Optional[str]:
+        """
+        Name of a group of linked carousels, e.g. a main carousel and its
+        thumbnail strip. Carousels in the same group follow each other's page
+        changes on the client within the same frame, with no server round trip.
+        Only the carousel the user (or Python) moved fires on_page_changed.
+        """
+        return self._get_attr("syncGroup")
+
+    @sync_group.setter
+    def sync_group(self, value: Optional[str]):
+        self._set_attr("syncGroup", value)
+
+    # sync_mode property
+    @property
+    def sync_mode(self) -> Optional[CarouselSyncMode]:
+        """
+        How this carousel follows the other carousels in its sync_group.
+        Defaults to CarouselSyncMode.ANIMATE.
+        """
+        return self.__sync_mode
+
+    @sync_mode.setter
+    def sync_mode(self, value: Optional[CarouselSyncMode]):
+        self.__sync_mode = value
+        self._set_enum_attr("syncMode", value, CarouselSyncMode)
+
+    # sync_on_tap property
+    @property
+    def sync_on_tap(self) -> Optional[bool]:
+        """
+        If true, tapping a slide selects it for the whole sync_group.
+        Useful for thumbnail strips.
+        """
+        return self._get_attr("syncOnTap")
+
+    @sync_on_tap.setter
+    def sync_on_tap(self, value: Optional[bool]):
+        self._set_attr("syncOnTap", value)
+
+    # indicator property
+    @property
+    def indicator(self) -> Optional[CarouselIndicator]:
+        """
+        Page indicator drawn by the client. Page changes and dot taps update it
+        locally, so it costs no events or updates.
+        """
+        return self.__indicator
+
+    @indicator.setter
+    def indicator(self, value: Optional[CarouselIndicator]):
+        self.__indicator = value
+
+    # keyboard_navigation property
+    @property
+    def keyboard_navigation(self) -> Optional[bool]:
+        """
+        If true, the focused carousel handles arrow keys (left/right, or up/down
+        when vertical), Home, End, PageUp and PageDown on the client. Resulting
+        page changes are reported through on_page_changed.
+        """
+        return self._get_attr("keyboardNavigation")
+
+    @keyboard_navigation.setter
+    def keyboard_navigation(self, value: Optional[bool]):
+        self._set_attr("keyboardNavigation", value)
+
+    # autofocus property
+    @property
+    def autofocus(self) -> Optional[bool]:
+        """
+        Whether the carousel takes keyboard focus when first shown
+        (only if keyboard_navigation=True).
+        """
+        return self._get_attr("autofocus")
+
+    @autofocus.setter
+    def autofocus(self, value: Optional[bool]):
+        self._set_attr("autofocus", value)
+
     # Internal event handlers for JSON decoding
     def _on_page_changed_internal(self, e):
         """Internal handler that decodes JSON and calls user handler."""
+        self.__traffic.record_event("page_changed", e.data)
         if self.__on_page_changed_handler:
             try:
                 # Decode JSON data and create EventData object
@@ -581,6 +1438,7 @@ class FletCarouselSlider(ConstrainedControl):
 
     def _on_scrolled_internal(self, e):
         """Internal handler that decodes JSON and calls user handler."""
+        self.__traffic.record_event("scrolled", e.data)
         if self.__on_scrolled_handler:
             try:
                 # Decode JSON data and create EventData object
@@ -593,6 +1451,70 @@ class FletCarouselSlider(ConstrainedControl):
                 # Fallback: pass empty EventData if JSON decode fails
                 self.__on_scrolled_handler(EventData({}))
 
+    def _on_prefetch_internal(self, e):
+        """Internal handler that decodes JSON and calls user handler."""
+        if self.__on_prefetch_handler:
+            try:
+                data_dict = json.loads(e.data) if isinstance(e.data, str) else e.data
+                self.__on_prefetch_handler(EventData(data_dict))
+            except (json.JSONDecodeError, AttributeError):
+                self.__on_prefetch_handler(EventData({}))
+
+    def _on_request_more_internal(self, e):
+        """Internal handler that decodes JSON and calls user handler once per range."""
+        if self.__on_request_more_handler:
+            try:
+                data_dict = json.loads(e.data) if isinstance(e.data, str) else e.data
+                start = data_dict["start"]
+            except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+                return
+            # Skip ranges already loaded or already requested
+            if start < len(self.items) or start in self.__pending_more:
+                return
+            self.__pending_more.add(start)
+            self.__on_request_more_handler(EventData(data_dict))
+
+    def _on_auto_play_delayed_internal(self, e):
+        """Internal handler that decodes JSON and calls user handler."""
+        if self.__on_auto_play_delayed_handler:
+            try:
+                data_dict = json.loads(e.data) if isinstance(e.data, str) else e.data
+                self.__on_auto_play_delayed_handler(EventData(data_dict))
+            except (json.JSONDecodeError, AttributeError):
+                self.__on_auto_play_delayed_handler(EventData({}))
+
+    def _on_resync_internal(self, e):
+        """Resends the asset payloads a reconnected client no longer holds."""
+        self.__traffic.record_event("resync", e.data)
+        try:
+            data_dict = json.loads(e.data) if isinstance(e.data, str) else e.data
+            cached = set(data_dict.get("assets") or [])
+        except (json.JSONDecodeError, AttributeError):
+            return
+        if not self.page:
+            return
+        session_assets.retain(self.page, cached)
+        if any(
+            asset_id not in cached
+            for asset_id in collect_assets(self._get_children())
+        ):
+            self._update_if_mounted()
+
+    def _on_hydrate_internal(self, e):
+        """Sends the items once the carousel first becomes visible."""
+        if not self.__awaiting_hydration():
+            return
+        self.__hydrated = True
+        self._set_attr("hydrated", True)
+        if self.__on_hydrate_handler:
+            self.__on_hydrate_handler(EventData({}))
+        if self.progressive:
+            self.__withhold_distant_items()
+        if self.page:
+            self.update()
+            if self.progressive and self.__withheld:
+                self.__stream_items()
+
     # Event handlers
     @property
     def on_page_changed(self) -> OptionalControlEventCallable:
@@ -657,15 +1579,137 @@ class FletCarouselSlider(ConstrainedControl):
         # Auto-enable scroll events if a handler is attached
         if handler is not None and not (self.enable_scroll_events or False):
             self.enable_scroll_events = True
-            if self.page:
-                self.update()
+            self._update_if_mounted()
         # Optionally disable when handler removed (keeping current behavior to avoid flicker)
         # elif handler is None and (self.enable_scroll_events or False):
         #     self.enable_scroll_events = False
         #     if self.page:
         #         self.update()
 
+    @property
+    def on_prefetch(self) -> OptionalControlEventCallable:
+        """
+        Called when the client predicts which pages the user is scrolling towards
+        (only if prefetch_pages > 0).
+
+        Args:
+            data (EventData): Event data object with attribute and dict-style access:
+                - data.pages (list[int]): Predicted page indexes, nearest first
+                - data.direction (str): "forward" or "backward"
+                - data.velocity (float): Scroll velocity in pages per second
+
+        Example:
+            def on_prefetch(data):
+                for index in data.pages:
+                    warm_up_slide(index)
+
+            carousel.prefetch_pages = 2
+            carousel.on_prefetch = on_prefetch
+        """
+        return self.__on_prefetch_handler
+
+    @on_prefetch.setter
+    def on_prefetch(self, handler: OptionalControlEventCallable):
+        self.__on_prefetch_handler = handler
+
+    @property
+    def on_request_more(self) -> OptionalControlEventCallable:
+        """
+        Called when the current page comes within request_more_threshold pages
+        of the last loaded item. Each range is requested only once; answer it
+        with append_items().
+
+        Args:
+            data (EventData): Event data object with attribute and dict-style access:
+                - data.start (int): Index of the first item to load
+                - data.count (int): Number of items to load
+
+        Example:
+            def on_request_more(data):
+                carousel.append_items(load_products(data.start, data.count))
+
+            carousel.request_more_threshold = 3
+            carousel.on_request_more = on_request_more
+        """
+        return self.__on_request_more_handler
+
+    @on_request_more.setter
+    def on_request_more(self, handler: OptionalControlEventCallable):
+        self.__on_request_more_handler = handler
+
+    @property
+    def on_auto_play_delayed(self) -> OptionalControlEventCallable:
+        """
+        Called when auto play had to wait for a slide that was not ready
+        (only if auto_play_wait_for_ready=True).
+
+        Args:
+            data (EventData): Event data object with attribute and dict-style access:
+                - data.index (int): The slide auto play was advancing to
+                - data.waited (int): How long the transition was held, in milliseconds
+                - data.timed_out (bool): True if auto play gave up waiting
+
+        Example:
+            def on_auto_play_delayed(data):
+                metrics.observe("slide_late_ms", data.waited)
+
+            carousel.on_auto_play_delayed = on_auto_play_delayed
+        """
+        return self.__on_auto_play_delayed_handler
+
+    @on_auto_play_delayed.setter
+    def on_auto_play_delayed(self, handler: OptionalControlEventCallable):
+        self.__on_auto_play_delayed_handler = handler
+
+    # on_hydrate property
+    @property
+    def on_hydrate(self) -> OptionalControlEventCallable:
+        """
+        Called when a carousel with hydrate=CarouselHydrate.VISIBLE first
+        scrolls into view, right before its items are sent.
+        Items assigned in this handler are sent with the same update.
+
+        Example:
+            def on_hydrate(data):
+                carousel.items = build_slides()
+
+            carousel.on_hydrate = on_hydrate
+        """
+        return self.__on_hydrate_handler
+
+    @on_hydrate.setter
+    def on_hydrate(self, handler: OptionalControlEventCallable):
+        self.__on_hydrate_handler = handler
+
+    def append_items(self, items: List[Control]):
+        """
+        Append items to the end of the carousel.
+
+        Only the new items are sent to the client. Pending on_request_more
+        ranges starting before the new end are marked as fulfilled.
+
+        Args:
+            items: The controls to append
+        """
+        self.items.extend(items)
+        self.__pending_more = {s for s in self.__pending_more if s >= len(self.items)}
+        self._update_if_mounted()
+
     # Controller methods
+    def invoke_method(
+        self,
+        method_name: str,
+        arguments: Optional[Dict[str, str]] = None,
+        wait_for_result: bool = False,
+        wait_timeout: Optional[float] = 5,
+    ) -> Optional[str]:
+        self.__traffic.record_method_call(method_name)
+        if self.__recorder:
+            self.__recorder.record_method_call(method_name, arguments)
+        return super().invoke_method(
+            method_name, arguments, wait_for_result, wait_timeout
+        )
+
     def next_page(self, animation: Optional[AnimationValue] = None):
         """
         Animate to the next page.
@@ -808,3 +1852,125 @@ class FletCarouselSlider(ConstrainedControl):
         Stop auto play if it's currently running.
         """
         return self.invoke_method("stop_auto_play", {}, wait_for_result=False)
+
+    @classmethod
+    def from_factory(
+        cls,
+        keys: Sequence[Any],
+        build_fn: Callable[[Any], Control],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> "FletCarouselSlider":
+        """
+        Create a carousel whose slides are built concurrently by `build_fn`.
+
+        The carousel is returned at once with a skeleton slot per key. Slides
+        are built nearest to initial_page first and sent as they finish, so
+        the carousel is usable after the slowest visible slide rather than
+        after all of them. Slides finishing while an update is in flight are
+        sent together in the next one. A slide whose build fails stays
+        a skeleton and the error is logged.
+
+        Args:
+            keys: One key per slide, passed to build_fn
+            build_fn: Builds the slide for a key
+            executor: Executor to build in. With a ProcessPoolExecutor,
+                build_fn and the slides it returns must be picklable.
+                Defaults to a private thread pool.
+            max_workers: Size of the default thread pool
+            **kwargs: Other FletCarouselSlider arguments
+
+        Examples:
+            carousel = FletCarouselSlider.from_factory(
+                product_ids, build_product_card, height=300, initial_page=4
+            )
+            page.add(carousel)
+        """
+        carousel = cls(items=[None] * len(keys), **kwargs)
+        carousel.__slots = True
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="carousel_factory"
+            )
+        for index in carousel.__nearest_first(len(keys)):
+            future = executor.submit(build_fn, keys[index])
+            future.add_done_callback(
+                lambda f, index=index: carousel.__on_slide_built(index, f)
+            )
+        if own_executor:
+            # Lets the submitted builds finish, then releases the threads
+            executor.shutdown(wait=False)
+        return carousel
+
+    def __on_slide_built(self, index: int, future):
+        try:
+            slide = future.result()
+        except Exception:
+            logger.exception("Failed to build carousel slide %d", index)
+            return
+        if index < len(self.items) and self.items[index] is None:
+            self.items[index] = slide
+            self.__flush_built_slides()
+
+    def __flush_built_slides(self):
+        """
+        Sends finished factory slides with one update in flight at a time.
+        Slides finishing meanwhile only mark the carousel dirty and go out
+        together in the next update.
+        """
+        with self.__built_lock:
+            if self.__flushing_built:
+                self.__built_dirty = True
+                return
+            self.__flushing_built = True
+        try:
+            while True:
+                self._update_if_mounted()
+                with self.__built_lock:
+                    if not self.__built_dirty:
+                        self.__flushing_built = False
+                        return
+                    self.__built_dirty = False
+        except BaseException:
+            with self.__built_lock:
+                self.__flushing_built = False
+            raise
+
+    def image_items(
+        self,
+        paths: List[str],
+        source: CarouselImageSource,
+        scale: float = 1.0,
+        **image_kwargs,
+    ) -> List[Control]:
+        """
+        Replace items with image slides backed by viewport-sized renditions.
+
+        Renditions are sized from the carousel's height, aspect_ratio and
+        viewport_fraction, so `height` should be set before calling this.
+
+        Args:
+            paths: Paths of the original images
+            source: The CarouselImageSource that generates and caches renditions
+            scale: Device pixel ratio to render for (e.g. 2.0 for high-DPI screens)
+            **image_kwargs: Extra arguments passed to every ft.Image
+
+        Returns:
+            The new list of items
+
+        Examples:
+            source = CarouselImageSource("assets/.renditions", assets_dir="assets")
+            carousel.image_items(["assets/photos/a.jpg"], source, scale=2.0)
+        """
+        self.items = source.image_items(
+            paths,
+            height=self.height or 400,
+            viewport_fraction=self.viewport_fraction or 0.8,
+            aspect_ratio=self.aspect_ratio or 16 / 9,
+            scale=scale,
+            **image_kwargs,
+        )
+        return self.items
@@ -0,0 +1,227 @@
+import hashlib
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flet.core.image import Image
+from flet.core.types import ImageFit
+
+
+def _render_rendition(
+    src: str, dest: str, box: Tuple[int, int], image_format: str, quality: int
+) -> str:
+    """
+    Worker function that writes a downscaled copy of `src` to `dest`.
+
+    Runs inside a worker process, so it must stay a module-level function.
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(src) as img:
+        img.thumbnail(box, PILImage.LANCZOS)
+        if image_format == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        tmp = f"{dest}.tmp"
+        img.save(tmp, image_format, quality=quality)
+    os.replace(tmp, dest)
+    return dest
+
+
+class CarouselImageSource:
+    """
+    Generates viewport-sized renditions of large images for carousel slides.
+
+    Renditions are produced in a process pool and kept in an on-disk cache
+    bounded by `max_cache_bytes`. When the cache grows past the budget, the
+    least recently used renditions are evicted first.
+
+    Requires Pillow (`pip install flet-carousel-slider[images]`).
+
+    Examples:
+        ```python
+        source = CarouselImageSource("assets/.renditions", assets_dir="assets")
+
+        carousel = FletCarouselSlider(height=300, viewport_fraction=0.8)
+        carousel.image_items(["photos/a.jpg", "photos/b.jpg"], source)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_cache_bytes: int = 256 * 1024 * 1024,
+        image_format: str = "JPEG",
+        quality: int = 85,
+        assets_dir: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ):
+        try:
+            import PIL  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "CarouselImageSource requires Pillow. "
+                "Install it with: pip install flet-carousel-slider[images]"
+            ) from e
+
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_cache_bytes = max_cache_bytes
+        self.image_format = image_format.upper()
+        self.quality = quality
+        self.assets_dir = os.path.abspath(assets_dir) if assets_dir else None
+        self.executor = executor
+        self.max_workers = max_workers
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def rendition_box(
+        height: float,
+        viewport_fraction: float = 0.8,
+        aspect_ratio: float = 16 / 9,
+        scale: float = 1.0,
+    ) -> Tuple[int, int]:
+        """
+        Returns the (width, height) in pixels a single slide occupies.
+
+        The carousel is `height * aspect_ratio` wide and each slide takes
+        `viewport_fraction` of that width. `scale` is the device pixel ratio
+        to render for (1.0, 2.0, ...).
+        """
+        width = height * aspect_ratio * viewport_fraction
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def renditions(
+        self, paths: Sequence[str], box: Tuple[int, int]
+    ) -> List[str]:
+        """
+        Returns the rendition path for each of `paths`, generating missing ones.
+
+        Images that cannot be read or decoded are returned unchanged.
+        """
+        results: List[str] = []
+        pending: Dict[str, Tuple[str, str]] = {}
+
+        for path in paths:
+            dest = self._rendition_path(path, box)
+            if dest is None:
+                results.append(path)
+            elif os.path.exists(dest):
+                self._touch(dest)
+                results.append(dest)
+            else:
+                pending[dest] = (path, dest)
+                results.append(dest)
+
+        if pending:
+            failed = self._generate(list(pending.values()), box)
+            results = [failed.get(r, r) for r in results]
+            self._evict()
+
+        return results
+
+    def image_items(
+        self,
+        paths: Sequence[str],
+        height: float,
+        viewport_fraction: float = 0.8,
+        aspect_ratio: float = 16 / 9,
+        scale: float = 1.0,
+        fit: Optional[ImageFit] = ImageFit.COVER,
+        **image_kwargs: Any,
+    ) -> List[Image]:
+        """
+        Returns `ft.Image` slides pointing at renditions sized for the carousel.
+
+        Extra keyword arguments are passed to every `ft.Image`.
+        """
+        box = self.rendition_box(height, viewport_fraction, aspect_ratio, scale)
+        return [
+            Image(src=self._src(path), fit=fit, **image_kwargs)
+            for path in self.renditions(paths, box)
+        ]
+
+    def clear(self):
+        """
+        Removes every rendition from the cache directory.
+        """
+        for name, _, _ in self._cache_entries():
+            os.remove(os.path.join(self.cache_dir, name))
+
+    def _rendition_path(self, path: str, box: Tuple[int, int]) -> Optional[str]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = "|".join(
+            [
+                os.path.abspath(path),
+                str(stat.st_mtime_ns),
+                str(stat.st_size),
+                f"{box[0]}x{box[1]}",
+                self.image_format,
+                str(self.quality),
+            ]
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        ext = "jpg" if self.image_format == "JPEG" else self.image_format.lower()
+        return os.path.join(self.cache_dir, f"{digest}.{ext}")
+
+    def _generate(
+        self, jobs: List[Tuple[str, str]], box: Tuple[int, int]
+    ) -> Dict[str, str]:
+        """
+        Renders `jobs` and returns a map of rendition path -> original path
+        for the ones that failed.
+        """
+        executor = self.executor or ProcessPoolExecutor(max_workers=self.max_workers)
+        failed = {}
+        try:
+            futures = {
+                executor.submit(
+                    _render_rendition, src, dest, box, self.image_format, self.quality
+                ): (src, dest)
+                for src, dest in jobs
+            }
+            for future, (src, dest) in futures.items():
+                try:
+                    future.result()
+                except Exception:
+                    failed[dest] = src
+        finally:
+            if executor is not self.executor:
+                executor.shutdown()
+        return failed
+
+    def _src(self, path: str) -> str:
+        if self.assets_dir:
+            abs_path = os.path.abspath(path)
+            if abs_path.startswith(self.assets_dir + os.sep):
+                rel = os.path.relpath(abs_path, self.assets_dir)
+                return "/" + rel.replace(os.sep, "/")
+        return path
+
+    def _touch(self, path: str):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _cache_entries(self) -> List[Tuple[str, float, int]]:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((entry.name, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._cache_entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+        for name, _, size in entries:
+            if total <= self.max_cache_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                total -= size
+            except OSError:
+                pass
@@ -0,0 +1,246 @@
+import copy
+import hashlib
+import re
+import types
+from typing import Any, Dict, List, Mapping, Optional
+
+from flet.core.control import Control
+from flet.core.event_handler import EventHandler
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+# Control classes whose serialization hooks are all Flet's own
+_FLET_HOOKS: Dict[type, bool] = {}
+
+# Mount state that a clone starts without
+_UNMOUNTED = (
+    "_Control__page",
+    "_Control__uid",
+    "_Control__attrs",
+    "_Control__previous_children",
+    "_Control__event_handlers",
+    "parent",
+)
+
+
+def clone_control(control: Control) -> Control:
+    """
+    Returns an unmounted copy of `control` and all of its descendants.
+
+    Everything the clone can mutate is its own: attribute dicts, lists,
+    styles and other values are copied, and every `EventHandler` is
+    duplicated so that assigning `on_*` on one clone never rebinds the
+    original or another clone. Immutable values such as strings are still
+    shared with the original.
+    """
+    clone = copy.copy(control)
+    fields = vars(clone)
+    handlers: Dict[int, EventHandler] = {}
+    for name, value in vars(control).items():
+        if name in _UNMOUNTED:
+            continue
+        if isinstance(value, EventHandler):
+            handlers[id(value)] = fields[name] = copy.copy(value)
+        else:
+            fields[name] = _clone_value(value)
+
+    clone._Control__attrs = {
+        name: (_clone_value(value), True)
+        for name, (value, _) in control._Control__attrs.items()
+        if name != "id"
+    }
+    clone._Control__event_handlers = {
+        name: _clone_handler(handler, control, clone, handlers)
+        for name, handler in control._Control__event_handlers.items()
+    }
+    clone._Control__previous_children = []
+    clone._Control__uid = None
+    clone._Control__page = None
+    clone.parent = None
+    return clone
+
+
+def bind_control(template: Control, target: Control, row: Mapping[str, Any]):
+    """
+    Applies `row` to `target`, a clone of `template`.
+
+    Every string attribute of the template containing `{field}` placeholders
+    is re-evaluated against `row`. Only values that actually change are marked
+    dirty, so re-binding an existing clone produces a minimal update diff.
+    Raises KeyError if `row` lacks a field a placeholder names.
+    """
+    for name, (value, _) in template._Control__attrs.items():
+        if isinstance(value, str) and "{" in value:
+            target._set_attr_internal(name, _substitute(value, row))
+
+    for template_child, target_child in zip(
+        template._get_children(), target._get_children()
+    ):
+        bind_control(template_child, target_child, row)
+
+
+def render_row(template: Control, row: Mapping[str, Any]) -> Control:
+    """
+    Returns a new slide built from `template` and bound to `row`.
+    """
+    control = clone_control(template)
+    bind_control(template, control, row)
+    return control
+
+
+def content_hash(control: Control) -> str:
+    """
+    Returns a hash of everything the client receives for `control`: its
+    type, serialized attributes and descendants. The position tag set by the
+    parent is ignored, so equal slides hash equally wherever they are.
+
+    Only Flet's own serialization hooks are run. A control whose class
+    overrides them elsewhere (e.g. an application subclass with its own
+    before_update) hashes uniquely, so it is never considered equal.
+    """
+    digest = hashlib.sha1()
+    _hash_into(control, digest)
+    return digest.hexdigest()
+
+
+def reconcile_controls(
+    previous: List[Optional[Control]], current: List[Optional[Control]]
+) -> List[Optional[Control]]:
+    """
+    Returns `current` with every new control that is structurally equal to a
+    mounted control of `previous` replaced by that mounted instance.
+
+    Flet diffs children by identity, so reusing the instances already on the
+    client keeps unchanged slides out of the update. Reused instances take
+    event handlers and `data` from the controls they replace.
+    """
+    kept = {id(c) for c in current if c is not None}
+    available: Dict[str, List[Control]] = {}
+    for control in previous:
+        if control is not None and control.uid is not None and id(control) not in kept:
+            available.setdefault(content_hash(control), []).append(control)
+    if not available:
+        return current
+
+    result = []
+    for control in current:
+        if control is not None and control.uid is None:
+            matches = available.get(content_hash(control))
+            if matches:
+                mounted = matches.pop(0)
+                _adopt_handlers(control, mounted)
+                control = mounted
+        result.append(control)
+    return result
+
+
+def _hash_into(control: Control, digest):
+    if not _flet_hooks(type(control)):
+        digest.update(f"\0<{id(control)}>".encode())
+        return
+    # Serialize JSON attributes the same way Flet does before sending
+    control._before_build_command()
+    control.before_update()
+    digest.update(control._get_control_name().encode())
+    for name, (value, _) in sorted(control._Control__attrs.items()):
+        if value is not None and name not in ("id", "n"):
+            digest.update(f"\0{name}={value}".encode())
+    children = control._get_children()
+    digest.update(f"\0[{len(children)}".encode())
+    for child in children:
+        _hash_into(child, digest)
+    digest.update(b"]")
+
+
+def _flet_hooks(cls: type) -> bool:
+    """
+    Whether the serialization hooks of `cls` all come from Flet itself.
+    """
+    flet_hooks = _FLET_HOOKS.get(cls)
+    if flet_hooks is None:
+        flet_hooks = all(
+            next(k for k in cls.__mro__ if hook in vars(k)).__module__.startswith(
+                "flet."
+            )
+            for hook in ("before_update", "_before_build_command", "_get_children")
+        )
+        _FLET_HOOKS[cls] = flet_hooks
+    return flet_hooks
+
+
+def _adopt_handlers(source: Control, target: Control):
+    # EventHandler-backed properties keep the target's own EventHandler
+    # objects, so later on_* assignments on the target still take effect
+    wrapped = {}
+    target_fields = vars(target)
+    for name, value in vars(source).items():
+        if isinstance(value, EventHandler):
+            wrapped[id(value)] = value
+            if isinstance(target_fields.get(name), EventHandler):
+                target_fields[name].handler = value.handler
+
+    handlers = target._Control__event_handlers
+    for name, handler in source._Control__event_handlers.items():
+        # Internal handlers bound to the source itself stay with the target's own
+        if getattr(handler, "__self__", None) is source or _wrapped_by(
+            handler, wrapped
+        ):
+            continue
+        handlers[name] = handler
+    target.data = source.data
+    for source_child, target_child in zip(
+        source._get_children(), target._get_children()
+    ):
+        _adopt_handlers(source_child, target_child)
+
+
+def _clone_value(value: Any) -> Any:
+    if isinstance(value, Control):
+        return clone_control(value)
+    if isinstance(value, list):
+        return [_clone_value(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_clone_value(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _clone_value(v) for k, v in value.items()}
+    return copy.deepcopy(value)
+
+
+def _clone_handler(
+    handler: Any, source: Control, target: Control, handlers: Dict[int, EventHandler]
+) -> Any:
+    if handler is None:
+        return None
+    # Internal handlers are methods of the control itself
+    if getattr(handler, "__self__", None) is source:
+        return types.MethodType(handler.__func__, target)
+    # EventHandler.get_handler() closures dispatch to their EventHandler
+    for cell in getattr(handler, "__closure__", None) or ():
+        try:
+            owner = cell.cell_contents
+        except ValueError:
+            continue
+        if id(owner) in handlers:
+            return handlers[id(owner)].get_handler()
+    return handler
+
+
+def _wrapped_by(handler: Any, event_handlers: Dict[int, EventHandler]) -> bool:
+    for cell in getattr(handler, "__closure__", None) or ():
+        try:
+            if id(cell.cell_contents) in event_handlers:
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def _substitute(value: str, row: Mapping[str, Any]) -> str:
+    def replace(match: "re.Match[str]") -> str:
+        field = match.group(1)
+        if field not in row:
+            raise KeyError(f"item_data row has no field {field!r} for {value!r}")
+        return str(row[field])
+
+    return _PLACEHOLDER.sub(replace, value)
+
@@ -0,0 +1,338 @@
+"""
+Offline load test for FletCarouselSlider.
+
+Drives N simulated sessions against real carousels. A local stand-in for the
+Flutter client receives the server's messages and plays back swipes,
+autoplay ticks, scroll streams and controller calls. The test then reports
+server CPU per session, messages and bytes per interaction, and handler
+latency percentiles.
+
+Run it with:
+
+    python -m flet_carousel_slider.loadtest --sessions 200 --interactions 100
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Union
+
+import flet as ft
+from flet.core.control_event import ControlEvent
+from flet.core.local_connection import LocalConnection
+from flet.core.page import Page
+from flet.core.protocol import CommandEncoder, PageCommandsBatchResponsePayload
+
+from flet_carousel_slider.flet_carousel_slider import FletCarouselSlider
+from flet_carousel_slider.traffic import _command_size
+
+INTERACTIONS = ("swipe", "autoplay", "scroll", "controller", "caption")
+
+
+class SimulatedClient(LocalConnection):
+    """
+    Stand-in for the Flutter client of one session.
+
+    It counts the messages and bytes the server sends, and the control
+    commands measured the way `CarouselTraffic` does. It answers controller
+    calls the way the carousel widget would: it tracks the current page and,
+    if `echo` is set, reports page changes back as `page_changed` events.
+    """
+
+    def __init__(self, item_count: int, echo: bool = True):
+        super().__init__()
+        self.echo = echo
+        self.page: Optional[Page] = None
+        self.carousel: Optional[FletCarouselSlider] = None
+        self.item_count = item_count
+        self.current_page = 0
+        self.messages = 0
+        self.bytes = 0
+        self.control_bytes = 0
+        self.latencies: List[float] = []
+
+    def send_command(self, session_id: str, command):
+        response = self.send_commands(session_id, [command])
+        result = response.results[0] if response.results else None
+        if command.name == "invokeMethod":
+            self._answer_method_call(*command.values, command.attrs)
+        return type("Result", (), {"result": result, "error": ""})()
+
+    def send_commands(self, session_id: str, commands):
+        results, messages = [], []
+        for command in commands:
+            if command.name == "add":
+                # The wrapper only says where the page puts the new controls
+                self.control_bytes += sum(_command_size(c) for c in command.commands)
+            elif command.name != "invokeMethod":
+                self.control_bytes += _command_size(command)
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if message:
+                messages.append(message)
+        self.messages += 1
+        self.bytes += len(json.dumps(messages, cls=CommandEncoder))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def dispatch(self, control, name: str, data: Union[Dict, str, None] = None):
+        """
+        Deliver an event to the server the way `Page.on_event_async` does.
+        The handler runs inline so its latency can be measured.
+        """
+        handler = control.event_handlers.get(name)
+        if handler is None:
+            return
+        if not isinstance(data, str):
+            data = json.dumps(data or {})
+        event = ControlEvent(control.uid, name, data, control, self.page)
+        started = time.perf_counter()
+        handler(event)
+        self.latencies.append(time.perf_counter() - started)
+
+    def change_page(self, page: int, reason: str):
+        if self.item_count:
+            page %= self.item_count
+        self.current_page = page
+        if not self.echo:
+            return
+        self.dispatch(
+            self.carousel, "page_changed", {"index": page, "reason": reason}
+        )
+
+    def _answer_method_call(self, method_id, method_name, control_id, args):
+        if method_name == "get_current_page":
+            self.dispatch(
+                self.page,
+                "invoke_method_result",
+                {
+                    "method_id": method_id,
+                    "result": str(self.current_page),
+                    "error": None,
+                },
+            )
+        elif method_name == "next_page":
+            self.change_page(self.current_page + 1, "controller")
+        elif method_name == "previous_page":
+            self.change_page(self.current_page - 1, "controller")
+        elif method_name in ("jump_to_page", "animate_to_page"):
+            self.change_page(int(args.get("page", 0)), "controller")
+
+
+def default_carousel(slides: int) -> FletCarouselSlider:
+    """
+    A typical carousel: image cards whose caption the page handler updates.
+    The "caption" interaction updates the caption control on its own.
+    """
+
+    def on_page_changed(data):
+        caption = carousel.items[data.index].content.controls[1]
+        caption.value = f"Slide {data.index + 1} of {slides}"
+        carousel.update()
+
+    carousel = FletCarouselSlider(
+        items=[
+            ft.Container(
+                content=ft.Column(
+                    [
+                        ft.Image(src=f"https://picsum.photos/id/{i}/800/450"),
+                        ft.Text(f"Slide {i + 1}"),
+                    ]
+                ),
+                border_radius=8,
+            )
+            for i in range(slides)
+        ],
+        height=300,
+        on_page_changed=on_page_changed,
+        on_scrolled=lambda data: None,
+    )
+    return carousel
+
+
+class LoadTest:
+    """
+    Keeps N sessions alive at once and interleaves their interactions.
+    """
+
+    def __init__(
+        self,
+        sessions: int,
+        interactions: int,
+        slides: int = 20,
+        scroll_events: int = 10,
+        build: Optional[Callable[[int], FletCarouselSlider]] = None,
+        seed: int = 0,
+    ):
+        self.sessions = sessions
+        self.interactions = interactions
+        self.slides = slides
+        self.scroll_events = scroll_events
+        self.build = build or default_carousel
+        self.random = random.Random(seed)
+        self.clients: List[SimulatedClient] = []
+        self.stats = defaultdict(lambda: {"count": 0, "messages": 0, "bytes": 0})
+        self.build_cpu = 0.0
+        self.interaction_cpu = 0.0
+
+    def run(self) -> Dict:
+        loop = asyncio.new_event_loop()
+        try:
+            started = time.process_time()
+            for i in range(self.sessions):
+                self._open_session(f"s{i}", loop)
+            self.build_cpu = time.process_time() - started
+
+            started = time.process_time()
+            for _ in range(self.interactions):
+                for client in self.clients:
+                    self._interact(client, self.random.choice(INTERACTIONS))
+            self.interaction_cpu = time.process_time() - started
+        finally:
+            loop.close()
+        return self.report()
+
+    def _open_session(self, session_id: str, loop):
+        client = SimulatedClient(self.slides)
+        page = Page(client, session_id, loop)
+        carousel = self.build(self.slides)
+        client.page = page
+        client.carousel = carousel
+        # Create the page view first, so every control command after it
+        # belongs to the carousel
+        page.update()
+        client.control_bytes = 0
+        page.add(carousel)
+        self.clients.append(client)
+
+    def _interact(self, client: SimulatedClient, kind: str):
+        messages, sent = client.messages, client.bytes
+        if kind == "swipe":
+            step = self.random.choice((-1, 1))
+            client.change_page(client.current_page + step, "manual")
+        elif kind == "autoplay":
+            client.change_page(client.current_page + 1, "timed")
+        elif kind == "scroll":
+            position = float(client.current_page)
+            for _ in range(self.scroll_events):
+                position += 1 / self.scroll_events
+                client.dispatch(client.carousel, "scrolled", {"position": position})
+        elif kind == "controller":
+            client.carousel.next_page()
+            client.carousel.get_current_page()
+        elif kind == "caption":
+            slide = client.carousel.items[client.current_page]
+            caption = slide.content.controls[1]
+            caption.value = f"Seen at {time.monotonic():.0f}"
+            caption.update()
+        stats = self.stats[kind]
+        stats["count"] += 1
+        stats["messages"] += client.messages - messages
+        stats["bytes"] += client.bytes - sent
+
+    def report(self) -> Dict:
+        latencies = sorted(
+            latency for client in self.clients for latency in client.latencies
+        )
+        interactions = {
+            kind: {
+                "count": stats["count"],
+                "messages_per_interaction": stats["messages"] / stats["count"],
+                "bytes_per_interaction": stats["bytes"] / stats["count"],
+            }
+            for kind, stats in self.stats.items()
+            if stats["count"]
+        }
+        return {
+            "sessions": self.sessions,
+            "interactions_per_session": self.interactions,
+            "cpu_ms_per_session": {
+                "build": self.build_cpu * 1000 / max(1, self.sessions),
+                "interactions": self.interaction_cpu * 1000 / max(1, self.sessions),
+            },
+            "interactions": interactions,
+            "control_bytes": {
+                "sent": sum(client.control_bytes for client in self.clients),
+                "counted": sum(
+                    client.carousel.traffic.attribute_bytes
+                    + client.carousel.traffic.children_bytes
+                    for client in self.clients
+                ),
+            },
+            "handler_latency_ms": {
+                f"p{p}": _percentile(latencies, p) * 1000 for p in (50, 90, 99)
+            }
+            | {"max": (latencies[-1] if latencies else 0) * 1000},
+        }
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(percent / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def _print_report(report: Dict):
+    print(
+        f"{report['sessions']} sessions x "
+        f"{report['interactions_per_session']} interactions"
+    )
+    cpu = report["cpu_ms_per_session"]
+    print(
+        f"CPU per session: {cpu['build']:.2f} ms build, "
+        f"{cpu['interactions']:.2f} ms interactions"
+    )
+    print(f"{'interaction':<12}{'count':>8}{'msgs/op':>10}{'bytes/op':>12}")
+    for kind, stats in sorted(report["interactions"].items()):
+        print(
+            f"{kind:<12}{stats['count']:>8}"
+            f"{stats['messages_per_interaction']:>10.2f}"
+            f"{stats['bytes_per_interaction']:>12.1f}"
+        )
+    control_bytes = report["control_bytes"]
+    print(
+        f"Control bytes: {control_bytes['sent']} sent, "
+        f"{control_bytes['counted']} counted by carousel.traffic"
+    )
+    latency = report["handler_latency_ms"]
+    print(
+        "Handler latency (ms): "
+        + ", ".join(f"{name} {value:.3f}" for name, value in latency.items())
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m flet_carousel_slider.loadtest",
+        description="Load test FletCarouselSlider with simulated clients.",
+    )
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--interactions", type=int, default=50)
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--scroll-events", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print JSON report")
+    args = parser.parse_args(argv)
+
+    report = LoadTest(
+        sessions=args.sessions,
+        interactions=args.interactions,
+        slides=args.slides,
+        scroll_events=args.scroll_events,
+        seed=args.seed,
+    ).run()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    control_bytes = report["control_bytes"]
+    if control_bytes["sent"] != control_bytes["counted"]:
+        raise SystemExit("carousel.traffic does not match the bytes sent")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Memory footprint checks for FletCarouselSlider.
+
+Uses tracemalloc to measure the carousel's own memory per item at 10, 1k
+and 20k items and the memory of EventData per event. It also checks that a
+removed carousel releases its slides and that sessions materialized from
+the same SharedSlides share no mutable state. Exits with status 1 if a measurement
+exceeds its threshold.
+
+Run it with:
+
+    python -m flet_carousel_slider.memcheck
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import tracemalloc
+import weakref
+from typing import Dict, List, Optional
+
+import flet as ft
+from flet.core.page import Page
+
+from flet_carousel_slider.flet_carousel_slider import (
+    EventData,
+    FletCarouselSlider,
+    _ITEM_NAMES,
+    _ITEM_NAMES_LOCK,
+)
+from flet_carousel_slider.loadtest import SimulatedClient
+from flet_carousel_slider.shared_slides import SharedSlides
+
+SIZES = (10, 1000, 20000)
+
+# Regression thresholds, in bytes
+THRESHOLDS = {
+    "carousel_base": 16 * 1024,
+    # Includes the child name created for the item, about 65 B
+    "carousel_per_item": 208,
+    "event_data_per_event": 512,
+}
+
+
+def _traced() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure_carousel(size: int) -> Dict:
+    """
+    Memory the carousel itself adds on top of `size` prebuilt slides:
+    construction, tagging the children and preparing the first update.
+
+    The child names shared by all carousels in the process are dropped
+    first, so the names this carousel creates count towards its items, as
+    they do for the largest carousel of a process.
+    """
+    items = [ft.Text(f"Slide {i}") for i in range(size)]
+    with _ITEM_NAMES_LOCK:
+        _ITEM_NAMES.clear()
+    before = _traced()
+    carousel = FletCarouselSlider(items=items, on_page_changed=lambda data: None)
+    constructed = _traced()
+    carousel.before_update()
+    carousel._get_children()
+    prepared = _traced()
+    del carousel
+    return {
+        "items": size,
+        "base": constructed - before,
+        "per_item": (prepared - constructed) / size,
+    }
+
+
+def measure_event_data(events: int = 10000) -> float:
+    """
+    Memory of one EventData kept alive per page_changed event.
+    """
+    payloads = [
+        json.dumps({"index": i, "reason": "manual"}) for i in range(events)
+    ]
+    before = _traced()
+    kept = [EventData(json.loads(payload)) for payload in payloads]
+    after = _traced()
+    del kept
+    return (after - before) / events
+
+
+def check_release(size: int = 1000) -> int:
+    """
+    Removes a carousel that the caller still references and returns how
+    many of its slides are still alive afterwards.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        client = SimulatedClient(size)
+        page = Page(client, "memcheck", loop)
+        items = [ft.Text(f"Slide {i}") for i in range(size)]
+        refs = [weakref.ref(item) for item in items]
+        carousel = FletCarouselSlider(
+            items=items,
+            on_page_changed=lambda data: None,
+            release_on_unmount=True,
+        )
+        del items
+        client.page = page
+        client.carousel = carousel
+        page.add(carousel)
+        page.remove(carousel)
+        gc.collect()
+        return sum(1 for ref in refs if ref() is not None)
+    finally:
+        loop.close()
+
+
+def check_shared_slides() -> List[str]:
+    """
+    Materializes the same SharedSlides for two sessions, changes handlers
+    and children in the first one and returns what leaked into the second
+    session or the definitions.
+    """
+    slides = SharedSlides(
+        [
+            ft.GestureDetector(
+                content=ft.Column(controls=[ft.Text("Slide")]),
+                on_tap_down=lambda e: None,
+            )
+        ]
+    )
+    definition = slides._SharedSlides__slides[0]
+    first, second = slides.materialize()[0], slides.materialize()[0]
+
+    first.on_tap_down = lambda e: None
+    first.on_tap = lambda e: None
+    first.content.controls.append(ft.Text("Extra"))
+
+    leaks = []
+    for name, other in (("second session", second), ("definition", definition)):
+        if other.on_tap_down is first.on_tap_down or other.on_tap is first.on_tap:
+            leaks.append(f"{name} shares handlers with the first session")
+        if set(map(id, other.event_handlers.values())) & set(
+            map(id, filter(None, first.event_handlers.values()))
+        ):
+            leaks.append(f"{name} shares handler dict entries with the first session")
+        if len(other.content.controls) != 1:
+            leaks.append(f"{name} shares child lists with the first session")
+    return leaks
+
+
+def run(sizes=SIZES) -> Dict:
+    tracemalloc.start()
+    try:
+        carousels = [measure_carousel(size) for size in sizes]
+        event_data = measure_event_data()
+        retained = check_release()
+    finally:
+        tracemalloc.stop()
+
+    failures: List[str] = []
+    for result in carousels:
+        if result["base"] > THRESHOLDS["carousel_base"]:
+            failures.append(
+                f"carousel base at {result['items']} items: {result['base']} B"
+            )
+        if result["per_item"] > THRESHOLDS["carousel_per_item"]:
+            failures.append(
+                f"carousel per item at {result['items']} items: "
+                f"{result['per_item']:.1f} B"
+            )
+    if event_data > THRESHOLDS["event_data_per_event"]:
+        failures.append(f"EventData per event: {event_data:.1f} B")
+    if retained:
+        failures.append(f"{retained} slides still alive after removal")
+    shared_leaks = check_shared_slides()
+    failures.extend(shared_leaks)
+
+    return {
+        "carousel": carousels,
+        "event_data_per_event": event_data,
+        "retained_after_removal": retained,
+        "shared_slides_leaks": shared_leaks,
+        "thresholds": THRESHOLDS,
+        "failures": failures,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m flet_carousel_slider.memcheck",
+        description="Measure FletCarouselSlider memory against thresholds.",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(SIZES), help="item counts"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON report")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for result in report["carousel"]:
+            print(
+                f"{result['items']:>6} items: base {result['base']} B, "
+                f"{result['per_item']:.1f} B per item"
+            )
+        print(f"EventData: {report['event_data_per_event']:.1f} B per event")
+        print(f"Slides alive after removal: {report['retained_after_removal']}")
+        print(f"SharedSlides leaks between sessions: {len(report['shared_slides_leaks'])}")
+        for failure in report["failures"]:
+            print(f"FAIL {failure}")
+    sys.exit(1 if report["failures"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Recording and replay of a carousel's event and command streams.
+
+A trace is a gzip-compressed JSON-lines file. The first line is a header.
+Every following line is `[ms, kind, name, payload, external]`:
+
+- `ms` is the time since recording started, in milliseconds.
+- `kind` is "e" for incoming events, "m" for controller calls and "u" for
+  update diffs.
+- `external` is true for calls and diffs that did not come from one of the
+  carousel's event handlers.
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from flet.core.protocol import CommandEncoder
+
+from flet_carousel_slider.traffic import _command_size
+
+TRACE_VERSION = 1
+
+
+class CarouselRecorder:
+    """
+    Records every incoming event, controller call and update diff of a
+    carousel. Recording starts when the recorder is assigned to
+    `carousel.recorder` and stops when it is set to None.
+
+    Examples:
+        ```python
+        carousel.recorder = CarouselRecorder("carousel-trace.jsonl.gz")
+        ...
+        carousel.recorder = None
+        ```
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__file = None
+        self.__started = 0.0
+        self.__lock = threading.Lock()
+        self.__handler_depth = threading.local()
+        self.__originals: Dict[str, Callable] = {}
+
+    def attach(self, carousel):
+        """
+        Starts recording `carousel`. Called by the `recorder` property.
+        """
+        self.__file = gzip.open(self.path, "wt", encoding="utf-8")
+        self.__started = time.perf_counter()
+        self.__write({"v": TRACE_VERSION, "items": len(carousel.items)})
+        handlers = carousel.event_handlers
+        for name, handler in list(handlers.items()):
+            self.__originals[name] = handler
+            handlers[name] = self.__wrap(name, handler)
+
+    def detach(self, carousel):
+        """
+        Stops recording `carousel` and closes the trace file.
+        """
+        carousel.event_handlers.update(self.__originals)
+        self.__originals.clear()
+        with self.__lock:
+            if self.__file:
+                self.__file.close()
+                self.__file = None
+
+    def record_method_call(self, method_name: str, arguments: Optional[Dict]):
+        self.__record("m", method_name, arguments or {})
+
+    def record_update(self, commands: List):
+        self.__record(
+            "u",
+            "diff",
+            {"bytes": sum(_command_size(c) for c in commands), "commands": commands},
+        )
+
+    def __wrap(self, name: str, handler: Callable) -> Callable:
+        def recorded(e):
+            self.__record("e", name, e.data)
+            depth = getattr(self.__handler_depth, "value", 0)
+            self.__handler_depth.value = depth + 1
+            try:
+                return handler(e)
+            finally:
+                self.__handler_depth.value = depth
+
+        return recorded
+
+    def __record(self, kind: str, name: str, payload: Any):
+        external = getattr(self.__handler_depth, "value", 0) == 0
+        ms = round((time.perf_counter() - self.__started) * 1000, 3)
+        self.__write([ms, kind, name, payload, external])
+
+    def __write(self, entry):
+        line = json.dumps(entry, cls=CommandEncoder, separators=(",", ":"))
+        with self.__lock:
+            if self.__file:
+                self.__file.write(line + "\n")
+
+
+class CarouselReplayer:
+    """
+    Feeds a recorded trace back into a carousel running against a stand-in
+    client, to benchmark handler and serialization changes on real traces.
+
+    Recorded events are replayed in order. Controller calls that did not come
+    from an event handler are re-issued. Calls and diffs made by handlers are
+    produced again by the handlers themselves and are compared with the trace.
+
+    Examples:
+        ```python
+        report = CarouselReplayer("carousel-trace.jsonl.gz").replay(
+            build_carousel, speed=None
+        )
+        print(report["handler_latency_ms"], report["replayed"])
+        ```
+    """
+
+    def __init__(self, path: str):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines or lines[0].get("v") != TRACE_VERSION:
+            raise ValueError(f"{path} is not a carousel trace")
+        self.header: Dict = lines[0]
+        self.entries: List[list] = lines[1:]
+
+    def replay(self, build: Callable[[], Any], speed: Optional[float] = 1.0) -> Dict:
+        """
+        Replays the trace against the carousel returned by `build`.
+
+        Args:
+            build: Creates the carousel to replay against
+            speed: Playback speed relative to the recording; None replays
+                as fast as possible
+
+        Returns:
+            A report dict comparing the recorded and replayed traffic
+        """
+        import asyncio
+
+        from flet.core.page import Page
+
+        from flet_carousel_slider.loadtest import SimulatedClient, _percentile
+
+        client = SimulatedClient(self.header.get("items", 0), echo=False)
+        loop = asyncio.new_event_loop()
+        try:
+            page = Page(client, "replay", loop)
+            carousel = build()
+            client.page = page
+            client.carousel = carousel
+            page.add(carousel)
+            carousel.traffic.reset()
+
+            started = time.perf_counter()
+            for ms, kind, name, payload, external in self.entries:
+                if speed:
+                    delay = started + ms / 1000 / speed - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                if kind == "e":
+                    client.dispatch(carousel, name, payload)
+                elif kind == "m" and external:
+                    carousel.invoke_method(
+                        name, payload, wait_for_result=name.startswith("get_")
+                    )
+            wall = time.perf_counter() - started
+        finally:
+            loop.close()
+
+        latencies = sorted(client.latencies)
+        updates = [e for e in self.entries if e[1] == "u"]
+        traffic = carousel.traffic.snapshot()
+        return {
+            "events": sum(1 for e in self.entries if e[1] == "e"),
+            "wall_ms": wall * 1000,
+            "handler_latency_ms": {
+                f"p{p}": _percentile(latencies, p) * 1000 for p in (50, 90, 99)
+            },
+            "recorded": {
+                "updates": len(updates),
+                "update_bytes": sum(e[3]["bytes"] for e in updates),
+                "method_calls": dict(
+                    Counter(e[2] for e in self.entries if e[1] == "m")
+                ),
+            },
+            "replayed": {
+                "updates": traffic["attributes"]["messages"]
+                + traffic["children"]["messages"],
+                "update_bytes": traffic["attributes"]["bytes"]
+                + traffic["children"]["bytes"],
+                "method_calls": traffic["method_calls"],
+            },
+        }
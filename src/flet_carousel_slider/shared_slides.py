@@ -0,0 +1,73 @@
+import threading
+from typing import Callable, Dict, List, Sequence
+
+from flet.core.control import Control
+
+from flet_carousel_slider.item_template import clone_control
+
+
+class SharedSlides:
+    """
+    Immutable slide definitions built once per process and shared by sessions.
+
+    Flet binds every control instance to a single page, so each session still
+    needs its own controls. SharedSlides keeps one frozen set of definitions
+    and gives each carousel lightweight clones. Expensive slide building
+    (data fetching, markdown rendering, etc.) runs once per process. The
+    clones also share the definitions' attribute values (texts, URLs, base64
+    payloads) by reference instead of holding their own copies.
+
+    Definitions must never be added to a page or mutated after creation.
+
+    Examples:
+        ```python
+        def build_home_slides():
+            return [promo_card(p) for p in load_promotions()]
+
+        def main(page: ft.Page):
+            slides = SharedSlides.shared("home", build_home_slides)
+            page.add(FletCarouselSlider(items=slides, height=300))
+        ```
+    """
+
+    _registry: Dict[str, "SharedSlides"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, slides: Sequence[Control]):
+        for slide in slides:
+            if slide.uid is not None:
+                raise ValueError(
+                    "SharedSlides definitions must not be added to a page"
+                )
+        self.__slides = tuple(slides)
+
+    @classmethod
+    def shared(cls, key: str, factory: Callable[[], Sequence[Control]]):
+        """
+        Return the process-wide definitions registered under `key`,
+        calling `factory` to build them the first time.
+        """
+        with cls._lock:
+            slides = cls._registry.get(key)
+            if slides is None:
+                slides = cls(factory())
+                cls._registry[key] = slides
+            return slides
+
+    @classmethod
+    def forget(cls, key: str):
+        """
+        Drop the definitions registered under `key`, e.g. after content changes.
+        Carousels already showing them keep their clones.
+        """
+        with cls._lock:
+            cls._registry.pop(key, None)
+
+    def materialize(self) -> List[Control]:
+        """
+        Return per-session controls cloned from the shared definitions.
+        """
+        return [clone_control(slide) for slide in self.__slides]
+
+    def __len__(self) -> int:
+        return len(self.__slides)
@@ -0,0 +1,181 @@
+import logging
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from flet.core.protocol import Command
+
+logger = logging.getLogger("flet_carousel_slider")
+
+
+def _command_size(command: Command) -> int:
+    """
+    Approximate payload size of a command: the length of its names and values.
+    Cheaper than serializing it a second time.
+    """
+    size = len(command.name or "")
+    for value in command.values:
+        size += len(value)
+    for name, value in command.attrs.items():
+        size += len(name) + len(value) if value is not None else len(name)
+    for child in command.commands:
+        size += _command_size(child)
+    return size
+
+
+class CarouselTraffic:
+    """
+    Running wire-traffic counters of one carousel.
+
+    Outgoing commands (the initial add, update diffs and updates of single
+    slides) are split into the carousel's own attributes and its children
+    (items added, removed or changed). Controller calls are counted by
+    method, and incoming events by name.
+
+    Examples:
+        ```python
+        carousel.traffic.log_every(60)
+        ...
+        print(carousel.traffic.snapshot())
+        ```
+    """
+
+    def __init__(self):
+        self.attribute_messages = 0
+        self.attribute_bytes = 0
+        self.children_messages = 0
+        self.children_bytes = 0
+        self.method_calls: Counter = Counter()
+        self.events: Counter = Counter()
+        self.event_bytes = 0
+        self.__report_interval: Optional[float] = None
+        self.__report_callback: Optional[Callable[[Dict], None]] = None
+        self.__last_report = time.monotonic()
+
+    def record_update(self, uid: Optional[str], commands: List[Command]):
+        """
+        Counts the diff commands one update of the carousel produced.
+        """
+        attributes = children = None
+        for command in commands:
+            size = _command_size(command)
+            if command.name == "set" and command.values[:1] == [uid]:
+                attributes = (attributes or 0) + size
+            else:
+                children = (children or 0) + size
+        if attributes is not None:
+            self.attribute_messages += 1
+            self.attribute_bytes += attributes
+        if children is not None:
+            self.children_messages += 1
+            self.children_bytes += children
+        self.__maybe_report()
+
+    def record_add(self, commands: List[Command]):
+        """
+        Counts the commands that add the carousel: its own attributes and
+        the controls of its initial children.
+        """
+        self.attribute_messages += 1
+        self.attribute_bytes += _command_size(commands[0])
+        if len(commands) > 1:
+            self.children_messages += 1
+            self.children_bytes += sum(_command_size(c) for c in commands[1:])
+        self.__maybe_report()
+
+    def record_method_call(self, method_name: str):
+        self.method_calls[method_name] += 1
+        self.__maybe_report()
+
+    def record_event(self, name: str, data: Optional[str]):
+        self.events[name] += 1
+        self.event_bytes += len(data) if isinstance(data, str) else 0
+        self.__maybe_report()
+
+    def snapshot(self) -> Dict:
+        """
+        Returns the current counts as a plain dict.
+        """
+        return {
+            "attributes": {
+                "messages": self.attribute_messages,
+                "bytes": self.attribute_bytes,
+            },
+            "children": {
+                "messages": self.children_messages,
+                "bytes": self.children_bytes,
+            },
+            "method_calls": dict(self.method_calls),
+            "events": dict(self.events),
+            "event_bytes": self.event_bytes,
+        }
+
+    def reset(self):
+        """
+        Clears all counts.
+        """
+        self.attribute_messages = self.attribute_bytes = 0
+        self.children_messages = self.children_bytes = 0
+        self.method_calls.clear()
+        self.events.clear()
+        self.event_bytes = 0
+
+    def log_every(
+        self,
+        seconds: Optional[float],
+        callback: Optional[Callable[[Dict], None]] = None,
+    ):
+        """
+        Report the counts at most once every `seconds`, checked as traffic
+        is recorded. By default the snapshot is logged at INFO level to the
+        "flet_carousel_slider" logger. Pass `None` to stop reporting.
+        """
+        self.__report_interval = seconds
+        self.__report_callback = callback
+        self.__last_report = time.monotonic()
+
+    def __maybe_report(self):
+        if self.__report_interval is None:
+            return
+        now = time.monotonic()
+        if now - self.__last_report < self.__report_interval:
+            return
+        self.__last_report = now
+        snapshot = self.snapshot()
+        if self.__report_callback:
+            self.__report_callback(snapshot)
+        else:
+            logger.info("carousel traffic: %s", snapshot)
+
+
+def track_nested_updates(page):
+    """
+    Makes `page` count updates started inside a carousel, such as
+    `slide.update()`, towards that carousel's traffic. A carousel's own
+    update only sees the diffs made while it is the control being diffed.
+
+    The page builds the commands of each updated control separately, so
+    each batch is attributed to the carousels above the control it came from.
+    """
+    if getattr(page, "_carousel_traffic_tracked", False):
+        return
+    prepare_update = page._Page__prepare_update
+
+    def prepare_tracked_update(*controls):
+        commands, added_controls, removed_controls = [], [], []
+        for control in controls:
+            c, added, removed = prepare_update(control)
+            if c:
+                ancestor = control.parent
+                while ancestor is not None:
+                    traffic = getattr(ancestor, "traffic", None)
+                    if isinstance(traffic, CarouselTraffic):
+                        traffic.record_update(ancestor.uid, c)
+                    ancestor = ancestor.parent
+            commands.extend(c)
+            added_controls.extend(added)
+            removed_controls.extend(removed)
+        return commands, added_controls, removed_controls
+
+    page._Page__prepare_update = prepare_tracked_update
+    page._carousel_traffic_tracked = True
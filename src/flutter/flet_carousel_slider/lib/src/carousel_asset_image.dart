@@ -0,0 +1,141 @@
+import 'dart:convert';
+
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+
+/// Session-wide cache of images sent by carousels as content-addressed assets.
+///
+/// Every carousel forwards its "assets" attribute here. Each payload is
+/// decoded once and the same [MemoryImage] instance is handed to every
+/// [CarouselAssetImageControl] that references it, so Flutter's image cache
+/// keeps a single decoded copy.
+///
+/// Each asset is held by the carousels that sent it or show it. When the
+/// last of them is disposed the asset is dropped, and a carousel that shows
+/// it later asks the server to send it again.
+class CarouselAssetCache {
+  static final Map<String, MemoryImage> _images = {};
+  static final Map<String, Set<Object>> _holders = {};
+  static final Map<Object, Set<String>> _held = {};
+  static final ValueNotifier<int> revision = ValueNotifier(0);
+
+  static MemoryImage? get(String? assetId) =>
+      assetId == null ? null : _images[assetId];
+
+  static Iterable<String> get ids => _images.keys;
+
+  static void register(Object holder, String? assetsJson) {
+    if (assetsJson == null || assetsJson.isEmpty) {
+      return;
+    }
+
+    final Map<String, dynamic> assets = json.decode(assetsJson);
+    bool changed = false;
+    assets.forEach((assetId, data) {
+      if (!_images.containsKey(assetId) && data is String) {
+        _images[assetId] = MemoryImage(base64Decode(data));
+        changed = true;
+      }
+      retain(holder, assetId);
+    });
+
+    if (changed) {
+      // Images waiting for an asset may be in the middle of building
+      WidgetsBinding.instance.addPostFrameCallback((_) {
+        revision.value++;
+      });
+    }
+  }
+
+  /// Marks a cached asset as used by [holder].
+  static void retain(Object holder, String assetId) {
+    if (!_images.containsKey(assetId)) {
+      return;
+    }
+    if ((_held[holder] ??= {}).add(assetId)) {
+      (_holders[assetId] ??= {}).add(holder);
+    }
+  }
+
+  /// Drops [holder]'s claims, and the assets nobody else holds.
+  static void release(Object holder) {
+    final Set<String>? assetIds = _held.remove(holder);
+    if (assetIds == null) {
+      return;
+    }
+    for (final assetId in assetIds) {
+      final Set<Object>? holders = _holders[assetId];
+      holders?.remove(holder);
+      if (holders == null || holders.isEmpty) {
+        _holders.remove(assetId);
+        _images.remove(assetId)?.evict();
+      }
+    }
+  }
+}
+
+/// Lets the carousel around a [CarouselAssetImageControl] know that the
+/// image references an asset the cache does not hold, whichever carousel
+/// originally sent its payload.
+class CarouselAssetScope extends InheritedWidget {
+  final Object holder;
+  final void Function(String assetId) onMissing;
+
+  const CarouselAssetScope({
+    super.key,
+    required this.holder,
+    required this.onMissing,
+    required super.child,
+  });
+
+  static CarouselAssetScope? maybeOf(BuildContext context) =>
+      context.getInheritedWidgetOfExactType<CarouselAssetScope>();
+
+  @override
+  bool updateShouldNotify(CarouselAssetScope oldWidget) => false;
+}
+
+class CarouselAssetImageControl extends StatelessWidget {
+  final Control? parent;
+  final Control control;
+
+  const CarouselAssetImageControl({
+    super.key,
+    required this.parent,
+    required this.control,
+  });
+
+  @override
+  Widget build(BuildContext context) {
+    final String? assetId = control.attrString("assetId");
+    final double? width = control.attrDouble("width");
+    final double? height = control.attrDouble("height");
+
+    Widget image = ValueListenableBuilder<int>(
+      valueListenable: CarouselAssetCache.revision,
+      builder: (context, _, __) {
+        final MemoryImage? provider = CarouselAssetCache.get(assetId);
+        final CarouselAssetScope? scope = CarouselAssetScope.maybeOf(context);
+        if (provider == null) {
+          if (assetId != null) {
+            scope?.onMissing(assetId);
+          }
+          return SizedBox(width: width, height: height);
+        }
+        if (scope != null) {
+          CarouselAssetCache.retain(scope.holder, assetId!);
+        }
+        return Image(
+          image: provider,
+          width: width,
+          height: height,
+          fit: parseBoxFit(control.attrString("fit")),
+          semanticLabel: control.attrString("semanticsLabel"),
+          gaplessPlayback: true,
+        );
+      },
+    );
+
+    return constrainedControl(context, image, parent, control);
+  }
+}
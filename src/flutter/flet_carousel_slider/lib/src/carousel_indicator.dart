@@ -0,0 +1,109 @@
+import 'dart:convert';
+import 'dart:math';
+
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+
+/// Page indicator drawn entirely on the client from the current page.
+class CarouselPageIndicator extends StatelessWidget {
+  final Map<String, dynamic> options;
+  final int pageCount;
+  final int currentPage;
+  final ValueChanged<int> onSelected;
+
+  const CarouselPageIndicator({
+    super.key,
+    required this.options,
+    required this.pageCount,
+    required this.currentPage,
+    required this.onSelected,
+  });
+
+  static Map<String, dynamic>? parse(String? value) {
+    if (value == null || value.isEmpty) {
+      return null;
+    }
+    return json.decode(value);
+  }
+
+  /// Places [indicator] relative to [carousel] according to "position".
+  static Widget wrap(Widget carousel, Widget indicator, String? position) {
+    switch (position) {
+      case "top":
+        return Column(
+          mainAxisSize: MainAxisSize.min,
+          children: [indicator, carousel],
+        );
+      case "overlayTop":
+        return Stack(children: [
+          carousel,
+          Positioned(top: 8, left: 0, right: 0, child: indicator),
+        ]);
+      case "overlayBottom":
+        return Stack(children: [
+          carousel,
+          Positioned(bottom: 8, left: 0, right: 0, child: indicator),
+        ]);
+      case "bottom":
+      default:
+        return Column(
+          mainAxisSize: MainAxisSize.min,
+          children: [carousel, indicator],
+        );
+    }
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    final theme = Theme.of(context);
+    final Color activeColor = parseColor(theme, options["active_color"]) ??
+        theme.colorScheme.primary;
+    final Color color = parseColor(theme, options["color"]) ??
+        theme.colorScheme.onSurface.withOpacity(0.3);
+    final double size = (options["size"] as num?)?.toDouble() ?? 8;
+    final double spacing = (options["spacing"] as num?)?.toDouble() ?? 8;
+
+    if (options["style"] == "fraction") {
+      return Padding(
+        padding: EdgeInsets.all(spacing),
+        child: Center(
+          child: Text(
+            "${currentPage + 1} / $pageCount",
+            style: TextStyle(color: activeColor, fontSize: size * 1.75),
+          ),
+        ),
+      );
+    }
+
+    // Show a window of dots centered on the current page
+    final int maxDots = (options["max_visible_dots"] as int?) ?? pageCount;
+    final int visible = min(pageCount, max(1, maxDots));
+    final int first =
+        (currentPage - visible ~/ 2).clamp(0, max(0, pageCount - visible));
+    final bool expanding = options["style"] == "expanding";
+
+    return Padding(
+      padding: EdgeInsets.symmetric(vertical: spacing),
+      child: Row(
+        mainAxisAlignment: MainAxisAlignment.center,
+        children: List.generate(visible, (i) {
+          final int page = first + i;
+          final bool active = page == currentPage;
+          return GestureDetector(
+            onTap: () => onSelected(page),
+            child: AnimatedContainer(
+              duration: const Duration(milliseconds: 200),
+              margin: EdgeInsets.symmetric(horizontal: spacing / 2),
+              width: expanding && active ? size * 3 : size,
+              height: size,
+              decoration: BoxDecoration(
+                color: active ? activeColor : color,
+                borderRadius: BorderRadius.circular(size / 2),
+              ),
+            ),
+          );
+        }),
+      ),
+    );
+  }
+}
@@ -0,0 +1,39 @@
+import 'package:flutter/widgets.dart';
+
+/// Keeps a slide's state alive while it is among the nearest pages.
+///
+/// When [keepAlive] turns false the slide is released the next time it
+/// scrolls out of view, so the furthest slides are evicted first.
+class CarouselKeepAlive extends StatefulWidget {
+  final bool keepAlive;
+  final Widget child;
+
+  const CarouselKeepAlive({
+    super.key,
+    required this.keepAlive,
+    required this.child,
+  });
+
+  @override
+  State<CarouselKeepAlive> createState() => _CarouselKeepAliveState();
+}
+
+class _CarouselKeepAliveState extends State<CarouselKeepAlive>
+    with AutomaticKeepAliveClientMixin {
+  @override
+  bool get wantKeepAlive => widget.keepAlive;
+
+  @override
+  void didUpdateWidget(CarouselKeepAlive oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    if (oldWidget.keepAlive != widget.keepAlive) {
+      updateKeepAlive();
+    }
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    super.build(context);
+    return widget.child;
+  }
+}
@@ -0,0 +1,20 @@
+/// Client-side memory of the page each carousel was showing.
+///
+/// When the connection drops and Flet rebuilds the page from its snapshot,
+/// a carousel recreated with the same control id resumes on the page it was
+/// showing instead of "initialPage".
+class CarouselResumeState {
+  // Bounded, so long-running clients do not accumulate an entry per carousel
+  static const int _maxEntries = 256;
+  static final Map<String, int> _pages = {};
+
+  static void remember(String controlId, int page) {
+    _pages.remove(controlId);
+    _pages[controlId] = page;
+    if (_pages.length > _maxEntries) {
+      _pages.remove(_pages.keys.first);
+    }
+  }
+
+  static int? restore(String controlId) => _pages[controlId];
+}
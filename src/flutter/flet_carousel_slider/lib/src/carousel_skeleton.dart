@@ -0,0 +1,17 @@
+import 'package:flutter/material.dart';
+
+/// Lightweight placeholder for a slide whose control has not arrived yet.
+class CarouselSkeleton extends StatelessWidget {
+  const CarouselSkeleton({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Container(
+      margin: const EdgeInsets.symmetric(horizontal: 4),
+      decoration: BoxDecoration(
+        color: Theme.of(context).colorScheme.onSurface.withOpacity(0.08),
+        borderRadius: BorderRadius.circular(8),
+      ),
+    );
+  }
+}
@@ -0,0 +1,73 @@
+import 'dart:io' show File;
+
+import 'package:flet/flet.dart';
+import 'package:flutter/foundation.dart';
+import 'package:flutter/widgets.dart';
+
+import 'carousel_asset_image.dart';
+
+/// Invisible widget that walks the control trees of [controlIds] in the
+/// page store and reports the image providers of their image controls.
+///
+/// The page view does not build a slide before it scrolls into view (the
+/// next page at viewport_fraction 1.0 included), so this lets a carousel
+/// load a slide's images ahead of time without building its controls twice.
+class CarouselSlideImages extends StatelessWidget with FletStoreMixin {
+  final List<String> controlIds;
+  final void Function(BuildContext context, List<ImageProvider> providers)
+      onImages;
+
+  const CarouselSlideImages({
+    super.key,
+    required this.controlIds,
+    required this.onImages,
+  });
+
+  @override
+  Widget build(BuildContext context) {
+    return withPageArgs((context, pageArgs) {
+      return withControls(controlIds, (context, controlsView) {
+        final List<ImageProvider> providers = [];
+        final List<String> childIds = [];
+        for (final view in controlsView.controlViews) {
+          final ImageProvider? provider =
+              _imageProvider(view.control, pageArgs);
+          if (provider != null) {
+            providers.add(provider);
+          }
+          childIds.addAll(
+              view.children.where((c) => c.isVisible).map((c) => c.id));
+        }
+        onImages(context, providers);
+        if (childIds.isEmpty) {
+          return const SizedBox.shrink();
+        }
+        return CarouselSlideImages(controlIds: childIds, onImages: onImages);
+      });
+    });
+  }
+
+  /// The provider Flet's image control will use, so loading it here fills
+  /// the same image cache entry. Base64 images decode inline and SVGs do not
+  /// go through the image cache, so they are skipped.
+  static ImageProvider? _imageProvider(
+      Control control, PageArgsModel pageArgs) {
+    switch (control.type) {
+      case "flet_carousel_asset_image":
+        return CarouselAssetCache.get(control.attrString("assetId"));
+      case "image":
+        final String? src = control.attrString("src");
+        if (src == null || src.isEmpty || src.toLowerCase().endsWith(".svg")) {
+          return null;
+        }
+        final AssetSrc asset =
+            getAssetSrc(src, pageArgs.pageUri!, pageArgs.assetsDir);
+        if (asset.isFile) {
+          return kIsWeb ? null : FileImage(File(asset.path));
+        }
+        return NetworkImage(asset.path);
+      default:
+        return null;
+    }
+  }
+}
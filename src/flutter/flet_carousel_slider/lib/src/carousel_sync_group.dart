@@ -0,0 +1,42 @@
+/// A carousel that can follow page changes of other carousels in its group.
+abstract class CarouselSyncMember {
+  void followPage(int page);
+}
+
+/// Client-side registry of linked carousels.
+///
+/// Carousels sharing a "syncGroup" name follow each other's page changes
+/// within the same frame, without a round trip to Python.
+class CarouselSyncGroups {
+  static final Map<String, Set<CarouselSyncMember>> _groups = {};
+
+  static void join(String group, CarouselSyncMember member) {
+    _groups.putIfAbsent(group, () => {}).add(member);
+  }
+
+  static void leave(String group, CarouselSyncMember member) {
+    final members = _groups[group];
+    if (members == null) {
+      return;
+    }
+    members.remove(member);
+    if (members.isEmpty) {
+      _groups.remove(group);
+    }
+  }
+
+  static bool debugContains(String group, CarouselSyncMember member) =>
+      _groups[group]?.contains(member) ?? false;
+
+  static void broadcast(String group, CarouselSyncMember source, int page) {
+    final members = _groups[group];
+    if (members == null) {
+      return;
+    }
+    for (final member in members.toList()) {
+      if (!identical(member, source)) {
+        member.followPage(page);
+      }
+    }
+  }
+}
@@ -1,5 +1,7 @@
 import 'package:flet/flet.dart';
 
+import 'carousel_asset_image.dart';
+import 'flet_carousel_grid.dart';
 import 'flet_carousel_slider.dart';
 
 CreateControlFactory createControl = (CreateControlArgs args) {
@@ -13,6 +15,20 @@ CreateControlFactory createControl = (CreateControlArgs args) {
         parentAdaptive: args.parentAdaptive,
         backend: args.backend,
       );
+    case "flet_carousel_grid":
+      return FletCarouselGridControl(
+        parent: args.parent,
+        control: args.control,
+        children: args.children,
+        parentDisabled: args.parentDisabled,
+        parentAdaptive: args.parentAdaptive,
+        backend: args.backend,
+      );
+    case "flet_carousel_asset_image":
+      return CarouselAssetImageControl(
+        parent: args.parent,
+        control: args.control,
+      );
     default:
       return null;
   }
@@ -0,0 +1,236 @@
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+import 'dart:convert';
+
+class FletCarouselGridControl extends StatefulWidget {
+  final Control? parent;
+  final Control control;
+  final List<Control> children;
+  final bool parentDisabled;
+  final bool? parentAdaptive;
+  final FletControlBackend backend;
+
+  const FletCarouselGridControl({
+    super.key,
+    required this.parent,
+    required this.control,
+    required this.children,
+    required this.parentDisabled,
+    required this.parentAdaptive,
+    required this.backend,
+  });
+
+  @override
+  State<FletCarouselGridControl> createState() =>
+      _FletCarouselGridControlState();
+}
+
+class _FletCarouselGridControlState extends State<FletCarouselGridControl> {
+  late PageController _rowController;
+  // Column controllers of the rows currently built, keyed by row index
+  final Map<int, PageController> _columnControllers = {};
+  // Last column shown in each row, so rows rebuilt later restore it
+  final Map<int, int> _rowColumns = {};
+  int _currentRow = 0;
+  double _viewportFraction = 0.8;
+
+  @override
+  void initState() {
+    super.initState();
+    _currentRow = widget.control.attrInt("initialRow", 0) ?? 0;
+    _rowColumns[_currentRow] = widget.control.attrInt("initialColumn", 0) ?? 0;
+    _rowController = PageController(initialPage: _currentRow);
+    widget.backend.subscribeMethods(widget.control.id, _onMethodCall);
+  }
+
+  @override
+  void dispose() {
+    widget.backend.unsubscribeMethods(widget.control.id);
+    _rowController.dispose();
+    super.dispose();
+  }
+
+  Future<String?> _onMethodCall(
+      String methodName, Map<String, String> args) async {
+    final int row = int.tryParse(args["row"] ?? "0") ?? 0;
+    final int column = int.tryParse(args["column"] ?? "0") ?? 0;
+    final int duration = int.tryParse(args["duration"] ?? "300") ?? 300;
+    final Curve curve = parseCurve(args["curve"] ?? "linear", Curves.linear)!;
+
+    switch (methodName) {
+      case "jump_to":
+        _rowColumns[row] = column;
+        _rowController.jumpToPage(row);
+        _columnControllers[row]?.jumpToPage(column);
+        return null;
+
+      case "animate_to":
+        if (duration <= 0) {
+          return _onMethodCall("jump_to", args);
+        }
+        _rowColumns[row] = column;
+        _rowController.animateToPage(row,
+            duration: Duration(milliseconds: duration), curve: curve);
+        _columnControllers[row]?.animateToPage(column,
+            duration: Duration(milliseconds: duration), curve: curve);
+        return null;
+
+      case "get_current_cell":
+        return json.encode(
+            {"row": _currentRow, "column": _rowColumns[_currentRow] ?? 0});
+
+      default:
+        return null;
+    }
+  }
+
+  void _onCellChanged(int row, int column) {
+    widget.backend.triggerControlEvent(
+      widget.control.id,
+      "cell_changed",
+      json.encode({"row": row, "column": column}),
+    );
+  }
+
+  PageController _columnControllerFor(int row) {
+    return _columnControllers.putIfAbsent(
+      row,
+      () => PageController(
+        initialPage: _rowColumns[row] ?? 0,
+        viewportFraction: _viewportFraction,
+      ),
+    );
+  }
+
+  void _releaseColumnController(int row, PageController controller) {
+    if (identical(_columnControllers[row], controller)) {
+      _columnControllers.remove(row);
+    }
+    controller.dispose();
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    // Index cells by position; only the visible ones are ever built
+    final Map<int, Map<int, Control>> cells = {};
+    for (final child in widget.children) {
+      final name = child.name;
+      if (name == null || !name.startsWith("cell_") || !child.isVisible) {
+        continue;
+      }
+      final parts = name.split("_");
+      final int? row = int.tryParse(parts[1]);
+      final int? column = int.tryParse(parts[2]);
+      if (row != null && column != null) {
+        cells.putIfAbsent(row, () => {})[column] = child;
+      }
+    }
+    final int rowCount =
+        cells.isEmpty ? 0 : cells.keys.reduce((a, b) => a > b ? a : b) + 1;
+
+    bool disabled = widget.control.isDisabled || widget.parentDisabled;
+    bool? adaptive =
+        widget.control.attrBool("adaptive") ?? widget.parentAdaptive;
+    final double? height = widget.control.attrDouble("height");
+    final double aspectRatio =
+        widget.control.attrDouble("aspectRatio", 16 / 9) ?? 16 / 9;
+    final double viewportFraction =
+        widget.control.attrDouble("viewportFraction", 0.8) ?? 0.8;
+    if (viewportFraction != _viewportFraction) {
+      _viewportFraction = viewportFraction;
+      // Existing rows pick up the new fraction when they are rebuilt
+      _columnControllers.clear();
+    }
+
+    Widget grid = PageView.builder(
+      controller: _rowController,
+      scrollDirection: Axis.vertical,
+      itemCount: rowCount,
+      onPageChanged: (row) {
+        _currentRow = row;
+        _onCellChanged(row, _rowColumns[row] ?? 0);
+      },
+      itemBuilder: (context, row) {
+        final rowCells = cells[row] ?? const {};
+        final int columnCount = rowCells.isEmpty
+            ? 0
+            : rowCells.keys.reduce((a, b) => a > b ? a : b) + 1;
+        return _CarouselGridRow(
+          key: ValueKey(row),
+          controller: _columnControllerFor(row),
+          onDispose: (controller) => _releaseColumnController(row, controller),
+          itemCount: columnCount,
+          onPageChanged: (column) {
+            _rowColumns[row] = column;
+            _onCellChanged(row, column);
+          },
+          itemBuilder: (context, column) {
+            final cell = rowCells[column];
+            if (cell == null) {
+              return const SizedBox.shrink();
+            }
+            return createControl(widget.control, cell.id, disabled,
+                parentAdaptive: adaptive);
+          },
+        );
+      },
+    );
+
+    grid = height != null
+        ? SizedBox(height: height, child: grid)
+        : AspectRatio(aspectRatio: aspectRatio, child: grid);
+
+    return constrainedControl(context, grid, widget.parent, widget.control);
+  }
+}
+
+/// A horizontal row of the grid that owns its column controller only while
+/// it is built.
+class _CarouselGridRow extends StatefulWidget {
+  final PageController controller;
+  final ValueChanged<PageController> onDispose;
+  final int itemCount;
+  final ValueChanged<int> onPageChanged;
+  final IndexedWidgetBuilder itemBuilder;
+
+  const _CarouselGridRow({
+    super.key,
+    required this.controller,
+    required this.onDispose,
+    required this.itemCount,
+    required this.onPageChanged,
+    required this.itemBuilder,
+  });
+
+  @override
+  State<_CarouselGridRow> createState() => _CarouselGridRowState();
+}
+
+class _CarouselGridRowState extends State<_CarouselGridRow> {
+  @override
+  void didUpdateWidget(_CarouselGridRow oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    if (!identical(oldWidget.controller, widget.controller)) {
+      // The PageView detaches from the old controller during this frame
+      final old = oldWidget.controller;
+      WidgetsBinding.instance
+          .addPostFrameCallback((_) => oldWidget.onDispose(old));
+    }
+  }
+
+  @override
+  void dispose() {
+    widget.onDispose(widget.controller);
+    super.dispose();
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    return PageView.builder(
+      controller: widget.controller,
+      itemCount: widget.itemCount,
+      onPageChanged: widget.onPageChanged,
+      itemBuilder: widget.itemBuilder,
+    );
+  }
+}
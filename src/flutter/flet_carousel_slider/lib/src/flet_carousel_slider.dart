@@ -1,8 +1,20 @@
 import 'package:flet/flet.dart';
 import 'package:flutter/material.dart';
 import 'package:flutter/gestures.dart';
+import 'package:flutter/painting.dart';
+import 'package:flutter/services.dart';
 import 'package:carousel_slider/carousel_slider.dart';
+import 'dart:async';
 import 'dart:convert';
+import 'dart:math';
+
+import 'carousel_asset_image.dart';
+import 'carousel_indicator.dart';
+import 'carousel_keep_alive.dart';
+import 'carousel_resume.dart';
+import 'carousel_skeleton.dart';
+import 'carousel_slide_images.dart';
+import 'carousel_sync_group.dart';
 
 class FletCarouselSliderControl extends StatefulWidget {
   final Control? parent;
@@ -27,28 +39,209 @@ class FletCarouselSliderControl extends StatefulWidget {
       _FletCarouselSliderControlState();
 }
 
-class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
-  late CarouselSliderController _carouselController;
+class _FletCarouselSliderControlState extends State<FletCarouselSliderControl>
+    implements CarouselSyncMember {
+  // Owner of each control id's method handler. A rebuilt carousel can
+  // subscribe before the state it replaces is disposed.
+  static final Map<String, _FletCarouselSliderControlState> _methodOwners = {};
+
+  CarouselSliderController? _controller;
+  // Keeps the slider's state (and page) when options add or remove the
+  // listeners, focus, indicator or image preloading wrapped around it
+  final GlobalKey _sliderKey = GlobalKey(debugLabel: "CarouselSlider");
+  CarouselSliderController get _carouselController => _controller!;
+  final FocusNode _focusNode = FocusNode(debugLabel: "FletCarouselSlider");
   int _currentPage = 0;
+  // Page shown before a reconnect rebuilt this carousel
+  int? _resumedPage;
   bool _autoPlay = false;
+  int _itemCount = 0;
+  int _pageCount = 0;
+
+  // Scroll velocity tracking for predictive prefetch
+  double? _lastScrollPosition;
+  DateTime? _lastScrollTime;
+  double _scrollVelocity = 0; // pages per second, smoothed
+  String? _lastPrefetchKey;
+
+  // Highest item count for which more items were already requested
+  int _requestedMoreAt = -1;
+
+  // Asset ids referenced by slides before their payload was cached, and
+  // every id a resync was already considered for
+  final Set<String> _missingAssets = {};
+  final Set<String> _requestedAssets = {};
+  // The "assets" attribute last registered, so builds skip decoding it again
+  String? _registeredAssets;
+
+  // Linked carousels
+  String? _syncGroup;
+  int? _followTarget;
+
+  // Client-side auto play driven by a per-slide schedule
+  Timer? _scheduleTimer;
+  List<int> _schedule = const [];
+  String? _scheduleKey;
+  bool _scheduleActive = false;
+  bool _pointerDown = false;
+  Duration _autoPlayAnimationDuration = const Duration(milliseconds: 800);
+  Curve _autoPlayCurve = Curves.fastOutSlowIn;
+  int _autoPlayInterval = 4000;
+  bool _waitForReady = false;
+  DateTime? _waitingSince;
+  // Image loads of the next page's slides while auto play waits for them
+  int? _imagesPage;
+  int _imagesPending = 0;
+  bool _imagesReported = false;
+
+  // Deferred hydration: items are requested when first scrolled into view
+  bool _hydrateRequested = false;
+  ScrollPosition? _hydratePosition;
 
   @override
   void initState() {
     super.initState();
-    _carouselController = CarouselSliderController();
+    _controller = CarouselSliderController();
+    _methodOwners[widget.control.id] = this;
     widget.backend.subscribeMethods(widget.control.id, _onMethodCall);
-    _currentPage = widget.control.attrInt("initialPage", 0) ?? 0;
+    _resumedPage = CarouselResumeState.restore(widget.control.id);
+    _currentPage =
+        _resumedPage ?? widget.control.attrInt("initialPage", 0) ?? 0;
     _autoPlay = widget.control.attrBool("autoPlay", false) ?? false;
   }
 
+  /// Called by slides whose asset is not in the cache. Payloads sent by
+  /// another carousel in the same update may still register this frame, so
+  /// the check runs after it.
+  void _onMissingAsset(String assetId) {
+    if (!_requestedAssets.add(assetId)) {
+      return;
+    }
+    if (_missingAssets.isEmpty) {
+      WidgetsBinding.instance.addPostFrameCallback((_) => _resyncAssets());
+    }
+    _missingAssets.add(assetId);
+  }
+
+  /// Tells Python which assets this client holds when slides reference
+  /// assets it lost (e.g. after a reload that kept the server session), so
+  /// the missing payloads are sent again.
+  void _resyncAssets() {
+    final bool missing =
+        _missingAssets.any((assetId) => CarouselAssetCache.get(assetId) == null);
+    _missingAssets.clear();
+    if (!mounted || !missing) {
+      return;
+    }
+    widget.backend.triggerControlEvent(
+      widget.control.id,
+      "resync",
+      json.encode({"assets": CarouselAssetCache.ids.toList()}),
+    );
+  }
+
+  @override
+  void didUpdateWidget(FletCarouselSliderControl oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    // Options read at creation time are re-applied here, so changing them
+    // from Python keeps the controller position and the items
+    final bool? autoPlay = widget.control.attrBool("autoPlay");
+    if (autoPlay != null &&
+        autoPlay != oldWidget.control.attrBool("autoPlay")) {
+      _autoPlay = autoPlay;
+    }
+    final int? initialPage = widget.control.attrInt("initialPage");
+    if (initialPage != null &&
+        initialPage != oldWidget.control.attrInt("initialPage") &&
+        initialPage != _currentPage) {
+      WidgetsBinding.instance.addPostFrameCallback((_) {
+        if (mounted) {
+          _carouselController.jumpToPage(initialPage);
+        }
+      });
+    }
+  }
+
+  @override
+  void didChangeDependencies() {
+    super.didChangeDependencies();
+    if (!_awaitingHydration) {
+      return;
+    }
+    final ScrollPosition? position = Scrollable.maybeOf(context)?.position;
+    if (!identical(position, _hydratePosition)) {
+      _hydratePosition?.removeListener(_checkHydrate);
+      _hydratePosition = position;
+      _hydratePosition?.addListener(_checkHydrate);
+    }
+    WidgetsBinding.instance.addPostFrameCallback((_) => _checkHydrate());
+  }
+
+  bool get _notHydrated =>
+      widget.control.attrString("hydrate") == "visible" &&
+      !(widget.control.attrBool("hydrated", false) ?? false);
+
+  bool get _awaitingHydration => !_hydrateRequested && _notHydrated;
+
+  /// Asks Python for the items once any part of the carousel is on screen.
+  void _checkHydrate() {
+    if (!mounted || !_awaitingHydration) {
+      return;
+    }
+    final RenderObject? box = context.findRenderObject();
+    if (box is! RenderBox || !box.attached || !box.hasSize) {
+      return;
+    }
+    final Rect rect = box.localToGlobal(Offset.zero) & box.size;
+    Rect viewport = Offset.zero & MediaQuery.sizeOf(context);
+    final RenderObject? scrollBox =
+        _hydratePosition?.context.notificationContext?.findRenderObject();
+    if (scrollBox is RenderBox && scrollBox.attached && scrollBox.hasSize) {
+      viewport = viewport.intersect(
+          scrollBox.localToGlobal(Offset.zero) & scrollBox.size);
+    }
+    if (!rect.overlaps(viewport)) {
+      return;
+    }
+    _hydrateRequested = true;
+    _hydratePosition?.removeListener(_checkHydrate);
+    _hydratePosition = null;
+    widget.backend.triggerControlEvent(widget.control.id, "hydrate", "");
+  }
+
   @override
   void dispose() {
-    widget.backend.unsubscribeMethods(widget.control.id);
+    _hydratePosition?.removeListener(_checkHydrate);
+    _hydratePosition = null;
+    CarouselResumeState.remember(widget.control.id, _currentPage);
+    _scheduleTimer?.cancel();
+    _scheduleTimer = null;
+    _focusNode.dispose();
+    CarouselAssetCache.release(this);
+    if (_syncGroup != null) {
+      CarouselSyncGroups.leave(_syncGroup!, this);
+      assert(!CarouselSyncGroups.debugContains(_syncGroup!, this),
+          "Disposed carousel is still linked to sync group $_syncGroup");
+      _syncGroup = null;
+    }
+    if (identical(_methodOwners[widget.control.id], this)) {
+      _methodOwners.remove(widget.control.id);
+      widget.backend.unsubscribeMethods(widget.control.id);
+    }
+    assert(!identical(_methodOwners[widget.control.id], this),
+        "Disposed carousel still handles method calls");
+    // carousel_slider keeps the disposed slider state in the controller
+    _controller = null;
+    assert(_scheduleTimer == null && _hydratePosition == null,
+        "Disposed carousel still holds a timer or scroll listener");
     super.dispose();
   }
 
   Future<String?> _onMethodCall(
       String methodName, Map<String, String> args) async {
+    if (!mounted) {
+      return null;
+    }
     switch (methodName) {
       case "next_page":
         final int duration = int.tryParse(args["duration"] ?? "300") ?? 300;
@@ -132,10 +325,103 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
     }
   }
 
+  /// Moves the carousel from arrow, Home, End, PageUp and PageDown keys
+  /// without involving Python.
+  KeyEventResult _onKeyEvent(FocusNode node, KeyEvent event) {
+    if (event is! KeyDownEvent && event is! KeyRepeatEvent) {
+      return KeyEventResult.ignored;
+    }
+    final bool vertical = _getScrollDirection(
+            widget.control.attrString("scrollDirection", "horizontal")) ==
+        Axis.vertical;
+    final key = event.logicalKey;
+    const duration = Duration(milliseconds: 300);
+    const curve = Curves.easeInOut;
+
+    if (key == LogicalKeyboardKey.pageDown ||
+        key == (vertical
+            ? LogicalKeyboardKey.arrowDown
+            : LogicalKeyboardKey.arrowRight)) {
+      _carouselController.nextPage(duration: duration, curve: curve);
+    } else if (key == LogicalKeyboardKey.pageUp ||
+        key == (vertical
+            ? LogicalKeyboardKey.arrowUp
+            : LogicalKeyboardKey.arrowLeft)) {
+      _carouselController.previousPage(duration: duration, curve: curve);
+    } else if (key == LogicalKeyboardKey.home) {
+      _carouselController.animateToPage(0, duration: duration, curve: curve);
+    } else if (key == LogicalKeyboardKey.end && _pageCount > 0) {
+      _carouselController.animateToPage(_pageCount - 1,
+          duration: duration, curve: curve);
+    } else {
+      return KeyEventResult.ignored;
+    }
+    return KeyEventResult.handled;
+  }
+
+  void _updateSyncGroup(String? group) {
+    if (group == _syncGroup) {
+      return;
+    }
+    if (_syncGroup != null) {
+      CarouselSyncGroups.leave(_syncGroup!, this);
+    }
+    _syncGroup = group;
+    if (group != null) {
+      CarouselSyncGroups.join(group, this);
+    }
+  }
+
+  @override
+  void followPage(int page) {
+    if (page == _currentPage || page >= _pageCount) {
+      return;
+    }
+    _followTarget = page;
+    if (widget.control.attrString("syncMode", "animate") == "jump") {
+      _carouselController.jumpToPage(page);
+      WidgetsBinding.instance.addPostFrameCallback((_) => _endFollow(page));
+    } else {
+      _carouselController
+          .animateToPage(
+            page,
+            duration: const Duration(milliseconds: 300),
+            curve: Curves.easeInOut,
+          )
+          .whenComplete(() => _endFollow(page));
+    }
+  }
+
+  /// Stops treating page changes as following once the jump or animation
+  /// to [page] is over, including when a drag interrupted it.
+  void _endFollow(int page) {
+    if (_followTarget == page) {
+      _followTarget = null;
+    }
+  }
+
   void _onPageChanged(int index, CarouselPageChangedReason reason) {
     setState(() {
       _currentPage = index;
     });
+    CarouselResumeState.remember(widget.control.id, index);
+
+    _restartScheduledAutoPlay();
+
+    // A drag takes over from an unfinished follow
+    if (reason == CarouselPageChangedReason.manual) {
+      _followTarget = null;
+    }
+    // Pages reached by following a linked carousel stay on the client
+    if (_followTarget != null) {
+      if (index == _followTarget) {
+        _followTarget = null;
+      }
+      return;
+    }
+    if (_syncGroup != null) {
+      CarouselSyncGroups.broadcast(_syncGroup!, this, index);
+    }
 
     // Trigger page changed event
     final eventData = {
@@ -148,9 +434,153 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
       "page_changed",
       json.encode(eventData),
     );
+
+    _checkRequestMore(index);
+  }
+
+  /// Asks Python for the next batch of items once [page] comes within
+  /// "requestMoreThreshold" pages of the last loaded item.
+  void _checkRequestMore(int page) {
+    final int threshold =
+        widget.control.attrInt("requestMoreThreshold", 0) ?? 0;
+    if (threshold <= 0 ||
+        _itemCount == 0 ||
+        _requestedMoreAt >= _itemCount ||
+        page < _pageCount - threshold) {
+      return;
+    }
+    _requestedMoreAt = _itemCount;
+
+    widget.backend.triggerControlEvent(
+      widget.control.id,
+      "request_more",
+      json.encode({
+        "start": _itemCount,
+        "count": widget.control.attrInt("requestMoreCount", 10) ?? 10,
+      }),
+    );
+  }
+
+  /// Starts the dwell timer for the current page when auto play runs from
+  /// "autoPlaySchedule" instead of carousel_slider's fixed interval.
+  void _restartScheduledAutoPlay() {
+    _scheduleTimer?.cancel();
+    _scheduleTimer = null;
+    _waitingSince = null;
+    if (!_scheduleActive || _pointerDown || _pageCount < 2) {
+      return;
+    }
+    final int interval = _schedule.isNotEmpty
+        ? _schedule[_currentPage % _schedule.length]
+        : _autoPlayInterval;
+    _scheduleTimer =
+        Timer(Duration(milliseconds: interval), _onScheduledAutoPlayTick);
+  }
+
+  void _onScheduledAutoPlayTick() {
+    _scheduleTimer = null;
+    if (!mounted) {
+      return;
+    }
+    if (_waitForReady && !_nextSlideReady()) {
+      return;
+    }
+    final bool infinite =
+        widget.control.attrBool("enableInfiniteScroll", true) ?? true;
+    if (!infinite && _currentPage >= _pageCount - 1) {
+      if (widget.control.attrBool("pauseAutoPlayInFiniteScroll", false) ??
+          false) {
+        return;
+      }
+      _carouselController.animateToPage(0,
+          duration: _autoPlayAnimationDuration, curve: _autoPlayCurve);
+    } else {
+      _carouselController.nextPage(
+          duration: _autoPlayAnimationDuration, curve: _autoPlayCurve);
+    }
+  }
+
+  /// Holds the tick while the next page's images are still loading, polling
+  /// until they are done or "autoPlayReadyTimeout" expires. Late slides are
+  /// reported to Python through the "auto_play_delayed" event.
+  bool _nextSlideReady() {
+    final now = DateTime.now();
+    _waitingSince ??= now;
+    final int waited = now.difference(_waitingSince!).inMilliseconds;
+    final int timeout =
+        widget.control.attrInt("autoPlayReadyTimeout", 3000) ?? 3000;
+    final bool ready = _pageCount > 0 &&
+        _imagesPage == (_currentPage + 1) % _pageCount &&
+        _imagesReported &&
+        _imagesPending == 0;
+
+    if (!ready && waited < timeout) {
+      _scheduleTimer =
+          Timer(const Duration(milliseconds: 100), _onScheduledAutoPlayTick);
+      return false;
+    }
+
+    _waitingSince = null;
+    if (waited > 0) {
+      widget.backend.triggerControlEvent(
+        widget.control.id,
+        "auto_play_delayed",
+        json.encode({
+          "index": (_currentPage + 1) % _pageCount,
+          "waited": waited,
+          "timed_out": !ready,
+        }),
+      );
+    }
+    return true;
+  }
+
+  /// Starts loading the images of [page], reported by [CarouselSlideImages]
+  /// before the page view builds the page.
+  void _loadSlideImages(
+      int page, BuildContext context, List<ImageProvider> providers) {
+    if (page != _imagesPage) {
+      return;
+    }
+    _imagesReported = true;
+    for (final provider in providers) {
+      _imagesPending++;
+      precacheImage(provider, context, onError: (_, __) {}).whenComplete(() {
+        if (page == _imagesPage && _imagesPending > 0) {
+          _imagesPending--;
+        }
+      });
+    }
+  }
+
+  void _updateAutoPlaySchedule(String? scheduleJson) {
+    final bool changed = scheduleJson != _scheduleKey;
+    if (changed) {
+      _scheduleKey = scheduleJson;
+      _schedule = scheduleJson == null || scheduleJson.isEmpty
+          ? const []
+          : (json.decode(scheduleJson) as List)
+              .map((ms) => (ms as num).toInt())
+              .toList();
+    }
+    final bool active = _autoPlay && (_schedule.isNotEmpty || _waitForReady);
+    if (active != _scheduleActive || changed) {
+      _scheduleActive = active;
+      _restartScheduledAutoPlay();
+    } else if (active && _scheduleTimer == null && !_pointerDown) {
+      _restartScheduledAutoPlay();
+    }
   }
 
   void _onScrolled(double? position) {
+    if (position != null) {
+      _trackScrollVelocity(position);
+    }
+
+    if (!(widget.control.attrBool("enableScrollEvents", false) ?? false)) {
+      return;
+    }
+
     // Pass the raw position from the carousel package without any formatting
     // This matches the native Flutter carousel_slider package behavior
     final eventData = {
@@ -164,25 +594,188 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
     );
   }
 
+  void _trackScrollVelocity(double position) {
+    final now = DateTime.now();
+    if (_lastScrollPosition != null && _lastScrollTime != null) {
+      final int elapsedMs = now.difference(_lastScrollTime!).inMilliseconds;
+      if (elapsedMs > 0) {
+        final double velocity =
+            (position - _lastScrollPosition!) / elapsedMs * 1000;
+        // Exponential moving average smooths out jittery frame timings
+        _scrollVelocity = _scrollVelocity * 0.6 + velocity * 0.4;
+      }
+    }
+    _lastScrollPosition = position;
+    _lastScrollTime = now;
+
+    _requestPrefetch(position);
+  }
+
+  /// Asks Python for the pages the carousel is heading towards, weighting the
+  /// window in the direction of travel by the current scroll velocity.
+  void _requestPrefetch(double position) {
+    final int prefetchPages = widget.control.attrInt("prefetchPages", 0) ?? 0;
+    if (prefetchPages <= 0 || _pageCount == 0) {
+      return;
+    }
+
+    final bool infinite =
+        widget.control.attrBool("enableInfiniteScroll", true) ?? true;
+    // carousel_slider offsets infinite carousels by 10000 pages
+    final double page = position - (infinite ? 10000 : 0);
+    final int direction = _scrollVelocity >= 0 ? 1 : -1;
+    // Pages covered in ~300ms at the current speed, on top of the base window
+    final int ahead = prefetchPages + (_scrollVelocity.abs() * 0.3).ceil();
+    final int behind = _scrollVelocity.abs() > 1 ? 0 : 1;
+    final int origin = direction > 0 ? page.floor() : page.ceil();
+
+    final List<int> pages = [];
+    for (int offset = -behind; offset <= ahead; offset++) {
+      int index = origin + offset * direction;
+      if (infinite) {
+        index = index % _pageCount;
+      } else if (index < 0 || index >= _pageCount) {
+        continue;
+      }
+      if (!pages.contains(index)) {
+        pages.add(index);
+      }
+    }
+
+    if (direction > 0 && !infinite) {
+      // Fast flings towards the end fetch the next batch early
+      _checkRequestMore(origin + ahead);
+    }
+
+    final String key = pages.join(",");
+    if (key == _lastPrefetchKey) {
+      return;
+    }
+    _lastPrefetchKey = key;
+
+    widget.backend.triggerControlEvent(
+      widget.control.id,
+      "prefetch",
+      json.encode({
+        "pages": pages,
+        "direction": direction > 0 ? "forward" : "backward",
+        "velocity": _scrollVelocity,
+      }),
+    );
+  }
+
   @override
   Widget build(BuildContext context) {
+    // Register shared image assets before any item references them
+    final String? assets = widget.control.attrString("assets");
+    if (assets != _registeredAssets) {
+      _registeredAssets = assets;
+      CarouselAssetCache.register(this, assets);
+    }
+
     // Get carousel items from children
     final itemControls = widget.children
         .where((c) => c.name?.startsWith("item_") == true && c.isVisible);
 
+    // With "itemCount" set, items fill slots by index and slots whose
+    // control has not arrived yet show a skeleton
+    final int? slotCount = widget.control.attrInt("itemCount");
+    List<Control?> slots = itemControls.toList();
+    if (slotCount != null) {
+      slots = List<Control?>.filled(slotCount, null);
+      for (final c in itemControls) {
+        final int? index = int.tryParse(c.name!.substring("item_".length));
+        if (index != null && index < slotCount) {
+          slots[index] = c;
+        }
+      }
+    }
+
     bool disabled = widget.control.isDisabled || widget.parentDisabled;
     bool? adaptive =
         widget.control.attrBool("adaptive") ?? widget.parentAdaptive;
     // Build carousel items
-    List<Widget> carouselItems = itemControls.map((itemControl) {
-      return createControl(
+    _updateSyncGroup(widget.control.attrString("syncGroup"));
+    final bool syncOnTap = _syncGroup != null &&
+        (widget.control.attrBool("syncOnTap", false) ?? false);
+
+    final int itemsPerPage =
+        max(1, widget.control.attrInt("itemsPerPage", 1) ?? 1);
+    final int keepAlivePages =
+        widget.control.attrInt("keepAlivePages", 0) ?? 0;
+    final bool enableInfiniteScroll =
+        widget.control.attrBool("enableInfiniteScroll", true) ?? true;
+    final Axis axis = _getScrollDirection(
+        widget.control.attrString("scrollDirection", "horizontal"));
+
+    List<Widget> cards = slots.asMap().entries.map((entry) {
+      if (entry.value == null) {
+        return const CarouselSkeleton();
+      }
+      Widget item = createControl(
         widget.control,
-        itemControl.id,
+        entry.value!.id,
         disabled,
         parentAdaptive: adaptive,
       );
+      if (syncOnTap) {
+        // Tapping a slide (e.g. a thumbnail) selects it for the whole group
+        item = GestureDetector(
+          behavior: HitTestBehavior.opaque,
+          onTap: () => _carouselController.animateToPage(
+            entry.key ~/ itemsPerPage,
+            duration: const Duration(milliseconds: 300),
+            curve: Curves.easeInOut,
+          ),
+          child: item,
+        );
+      }
+      return item;
     }).toList();
 
+    _itemCount = cards.length;
+
+    // Group cards into pages on the client, so each card stays its own control
+    List<Widget> carouselItems = cards;
+    if (itemsPerPage > 1) {
+      carouselItems = [];
+      for (int i = 0; i < cards.length; i += itemsPerPage) {
+        final group = cards
+            .sublist(i, min(i + itemsPerPage, cards.length))
+            .map((card) => Expanded(child: card))
+            .toList();
+        // Pad the last page so its cards keep the same size
+        while (group.length < itemsPerPage) {
+          group.add(const Expanded(child: SizedBox.shrink()));
+        }
+        carouselItems.add(axis == Axis.vertical
+            ? Column(children: group)
+            : Row(children: group));
+      }
+    }
+
+    _pageCount = carouselItems.length;
+
+    if (keepAlivePages > 0) {
+      carouselItems = carouselItems.asMap().entries.map<Widget>((entry) {
+        // An infinite carousel wraps around, so its last page is next to
+        // the first; a finite one does not
+        int distance = (entry.key - _currentPage).abs();
+        if (enableInfiniteScroll) {
+          distance = min(distance, _pageCount - distance);
+        }
+        return CarouselKeepAlive(
+          keepAlive: distance <= keepAlivePages,
+          child: entry.value,
+        );
+      }).toList();
+    }
+
+    // A carousel waiting for hydration is sized by a skeleton slide
+    if (carouselItems.isEmpty && _notHydrated) {
+      carouselItems = [const CarouselSkeleton()];
+    }
+
     // If no items provided, show placeholder
     if (carouselItems.isEmpty) {
       carouselItems = [
@@ -203,9 +796,8 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
         widget.control.attrDouble("aspectRatio", 16 / 9) ?? 16 / 9;
     final double viewportFraction =
         widget.control.attrDouble("viewportFraction", 0.8) ?? 0.8;
-    final int initialPage = widget.control.attrInt("initialPage", 0) ?? 0;
-    final bool enableInfiniteScroll =
-        widget.control.attrBool("enableInfiniteScroll", true) ?? true;
+    final int initialPage =
+        _resumedPage ?? widget.control.attrInt("initialPage", 0) ?? 0;
     final bool animateToClosest =
         widget.control.attrBool("animateToClosest", true) ?? true;
     final bool reverse = widget.control.attrBool("reverse", false) ?? false;
@@ -220,6 +812,13 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
         autoPlayAnimation?.duration?.inMilliseconds ?? 800;
     final Curve autoPlayCurveObj =
         autoPlayAnimation?.curve ?? Curves.fastOutSlowIn;
+    _autoPlayAnimationDuration =
+        Duration(milliseconds: autoPlayAnimationDuration);
+    _autoPlayCurve = autoPlayCurveObj;
+    _autoPlayInterval = autoPlayInterval;
+    _waitForReady =
+        widget.control.attrBool("autoPlayWaitForReady", false) ?? false;
+    _updateAutoPlaySchedule(widget.control.attrString("autoPlaySchedule"));
     final bool enlargeCenterPage =
         widget.control.attrBool("enlargeCenterPage", false) ?? false;
     final double enlargeFactor =
@@ -246,6 +845,9 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
     // Check if user wants scroll events (to avoid spam)
     final bool enableScrollEvents =
         widget.control.attrBool("enableScrollEvents", false) ?? false;
+    // Scroll positions also drive velocity-aware prefetch
+    final bool trackScroll = enableScrollEvents ||
+        (widget.control.attrInt("prefetchPages", 0) ?? 0) > 0;
 
     // Configure scroll physics for vertical carousels to prevent conflicts
     ScrollPhysics? scrollPhysics;
@@ -263,7 +865,8 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
       enableInfiniteScroll: enableInfiniteScroll,
       animateToClosest: animateToClosest,
       reverse: reverse,
-      autoPlay: autoPlay,
+      // Schedules and waiting for ready slides replace carousel_slider's timer
+      autoPlay: autoPlay && !_scheduleActive,
       autoPlayInterval: Duration(milliseconds: autoPlayInterval),
       autoPlayAnimationDuration:
           Duration(milliseconds: autoPlayAnimationDuration),
@@ -281,11 +884,12 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
       padEnds: padEnds,
       clipBehavior: parseClip(clipBehavior, Clip.hardEdge)!,
       onPageChanged: _onPageChanged,
-      onScrolled: enableScrollEvents ? _onScrolled : null,
+      onScrolled: trackScroll ? _onScrolled : null,
     );
 
     // Create the CarouselSlider widget
     Widget carouselSlider = CarouselSlider(
+      key: _sliderKey,
       items: carouselItems,
       carouselController: _carouselController,
       options: options,
@@ -316,6 +920,94 @@ class _FletCarouselSliderControlState extends State<FletCarouselSliderControl> {
       );
     }
 
+    if (_scheduleActive && pauseAutoPlayOnTouch) {
+      carouselSlider = Listener(
+        onPointerDown: (_) {
+          _pointerDown = true;
+          _scheduleTimer?.cancel();
+          _scheduleTimer = null;
+        },
+        onPointerUp: (_) {
+          _pointerDown = false;
+          _restartScheduledAutoPlay();
+        },
+        onPointerCancel: (_) {
+          _pointerDown = false;
+          _restartScheduledAutoPlay();
+        },
+        child: carouselSlider,
+      );
+    }
+
+    if (widget.control.attrBool("keyboardNavigation", false) ?? false) {
+      carouselSlider = Focus(
+        focusNode: _focusNode,
+        autofocus: widget.control.attrBool("autofocus", false) ?? false,
+        onKeyEvent: _onKeyEvent,
+        child: Listener(
+          // Clicking or touching the carousel gives it keyboard focus
+          onPointerDown: (_) => _focusNode.requestFocus(),
+          child: carouselSlider,
+        ),
+      );
+    }
+
+    final indicatorOptions =
+        CarouselPageIndicator.parse(widget.control.attrString("indicator"));
+    if (indicatorOptions != null && _pageCount > 1) {
+      carouselSlider = CarouselPageIndicator.wrap(
+        carouselSlider,
+        CarouselPageIndicator(
+          options: indicatorOptions,
+          pageCount: _pageCount,
+          currentPage: _currentPage,
+          onSelected: (page) => _carouselController.animateToPage(
+            page,
+            duration: const Duration(milliseconds: 300),
+            curve: Curves.easeInOut,
+          ),
+        ),
+        indicatorOptions["position"],
+      );
+    }
+
+    // Slides report assets missing from the cache to this carousel
+    carouselSlider = CarouselAssetScope(
+      holder: this,
+      onMissing: _onMissingAsset,
+      child: carouselSlider,
+    );
+
+    // Load the next page's images before the tick that scrolls to it
+    if (_waitForReady && _scheduleActive && _pageCount > 1) {
+      final int nextPage = (_currentPage + 1) % _pageCount;
+      if (nextPage != _imagesPage) {
+        _imagesPage = nextPage;
+        _imagesPending = 0;
+        _imagesReported = false;
+      }
+      final List<Control?> nextSlots = slots.sublist(
+          min(nextPage * itemsPerPage, slots.length),
+          min((nextPage + 1) * itemsPerPage, slots.length));
+      // Slides that have not arrived yet are not ready
+      if (nextSlots.isNotEmpty && !nextSlots.contains(null)) {
+        carouselSlider = Stack(
+          fit: StackFit.passthrough,
+          children: [
+            carouselSlider,
+            Offstage(
+              child: CarouselSlideImages(
+                key: ValueKey(nextPage),
+                controlIds: nextSlots.map((c) => c!.id).toList(),
+                onImages: (context, providers) =>
+                    _loadSlideImages(nextPage, context, providers),
+              ),
+            ),
+          ],
+        );
+      }
+    }
+
     return constrainedControl(
       context,
       carouselSlider,